@@ -9,6 +9,8 @@ from .beautifultable import (  # noqa F401
     BTRowHeader,
     BTColumnHeader,
     BTBorder,
+    BTRowGroupBy,
+    FrozenBeautifulTable,
     __all__,
 )
 from . import enums
@@ -35,6 +37,7 @@ for token in dir(enums):
         or token.startswith("ALIGN_")
         or token.startswith("SM_")
         or token.startswith("STYLE_")
+        or token.startswith("STORAGE_")
     ):
         setattr(BeautifulTable, token, getattr(enums, token))
         __all__.append(token)
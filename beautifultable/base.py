@@ -1,12 +1,26 @@
 import abc
 import weakref
+import array
+import itertools
+
+from .compat import Iterable
 
 
 class BTBaseList(metaclass=abc.ABCMeta):
+    __slots__ = ("_table_ref", "_value")
+
     def __init__(self, table, value):
         self._table = table
         self._value = self._validate(list(value))
 
+    @classmethod
+    def _wrap(cls, table, value):
+        """Create an instance around `value` without copying or validating it."""
+        obj = cls.__new__(cls)
+        obj._table = table
+        obj._value = value
+        return obj
+
     @property
     def _table(self):
         return self._table_ref()
@@ -51,6 +65,9 @@ class BTBaseList(metaclass=abc.ABCMeta):
     def _insert(self, i, item):
         self._value.insert(i, item)
 
+    def _extend(self, items):
+        self._value.extend(items)
+
     def _pop(self, i=-1):
         return self._value.pop(self._get_canonical_key(i))
 
@@ -63,6 +80,10 @@ class BTBaseList(metaclass=abc.ABCMeta):
     def _sort(self, key, reverse=False):
         self._value.sort(key=key, reverse=reverse)
 
+    def _permute(self, order):
+        value = self._value
+        self._value = type(value)([value[i] for i in order])
+
     def _clear(self):
         self._value.clear()
 
@@ -105,6 +126,8 @@ class BTBaseList(metaclass=abc.ABCMeta):
 
 
 class BTBaseRow(BTBaseList):
+    __slots__ = ()
+
     def _get_canonical_key(self, key):
         return self._table.columns._canonical_key(key)
 
@@ -118,6 +141,8 @@ class BTBaseRow(BTBaseList):
 
 
 class BTBaseColumn(BTBaseList):
+    __slots__ = ()
+
     def _get_canonical_key(self, key):
         return self._table.rows._canonical_key(key)
 
@@ -128,3 +153,250 @@ class BTBaseColumn(BTBaseList):
         if self._get_ideal_length() == 0 and len(value) > 0:
             self._table.rows._reset_state(len(value))
         return super(BTBaseColumn, self)._validate(value)
+
+
+class BTDequeList:
+    """List-like container with fast insertion and removal at both ends.
+
+    Items are split between two lists, the first of which is stored in
+    reverse order. Inserting or removing items near either end is amortized
+    O(1), while indexing stays O(1).
+    """
+
+    __slots__ = ("_front", "_back")
+
+    def __init__(self, iterable=()):
+        self._front = []
+        self._back = list(iterable)
+
+    def _tolist(self):
+        return self._front[::-1] + self._back
+
+    def _rebalance(self):
+        """Split the items evenly between both the lists."""
+        items = self._tolist()
+        mid = len(items) // 2
+        self._front = items[:mid][::-1]
+        self._back = items[mid:]
+
+    def _locate(self, index):
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("list index out of range")
+        nfront = len(self._front)
+        if index < nfront:
+            return self._front, nfront - 1 - index
+        return self._back, index - nfront
+
+    def __len__(self):
+        return len(self._front) + len(self._back)
+
+    def __iter__(self):
+        return itertools.chain(reversed(self._front), self._back)
+
+    def __reversed__(self):
+        return itertools.chain(reversed(self._back), self._front)
+
+    def __contains__(self, item):
+        return item in self._front or item in self._back
+
+    def __eq__(self, other):
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return self._tolist() == list(other)
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, self._tolist())
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._tolist()[key]
+        items, index = self._locate(key)
+        return items[index]
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            items = self._tolist()
+            items[key] = value
+            self._front, self._back = [], items
+        else:
+            items, index = self._locate(key)
+            items[index] = value
+
+    def __delitem__(self, key):
+        if isinstance(key, slice):
+            items = self._tolist()
+            del items[key]
+            self._front, self._back = [], items
+        else:
+            self.pop(key)
+
+    def append(self, item):
+        self._back.append(item)
+
+    def extend(self, items):
+        self._back.extend(items)
+
+    def insert(self, index, item):
+        length = len(self)
+        if index < 0:
+            index = max(index + length, 0)
+        nfront = len(self._front)
+        if index <= nfront:
+            self._front.insert(nfront - index, item)
+        else:
+            self._back.insert(min(index, length) - nfront, item)
+
+    def pop(self, index=-1):
+        length = len(self)
+        if length == 0:
+            raise IndexError("pop from empty list")
+        if index in (0, -length) and not self._front:
+            self._rebalance()
+        elif index in (-1, length - 1) and not self._back:
+            self._rebalance()
+        items, index = self._locate(index)
+        return items.pop(index)
+
+    def remove(self, item):
+        del self[self.index(item)]
+
+    def index(self, item, *args):
+        return self._tolist().index(item, *args)
+
+    def count(self, item):
+        return self._front.count(item) + self._back.count(item)
+
+    def reverse(self):
+        self._front, self._back = self._back, self._front
+
+    def sort(self, key=None, reverse=False):
+        items = self._tolist()
+        items.sort(key=key, reverse=reverse)
+        self._front, self._back = [], items
+
+    def clear(self):
+        self._front, self._back = [], []
+
+
+class BTEncodedList:
+    """List-like container which stores every distinct item only once.
+
+    Items are replaced by small integer codes which index into a table of
+    distinct items. Codes are stored in an array whose item size grows with
+    the number of distinct items. Items must be hashable. Items which are no
+    longer referenced are kept in the table until the list is cleared.
+    """
+
+    __slots__ = ("_codes", "_items", "_lookup")
+
+    # Array typecodes in increasing order of item size
+    _TYPECODES = "BHLQ"
+
+    def __init__(self, iterable=()):
+        self._codes = array.array(self._TYPECODES[0])
+        self._items = []
+        self._lookup = {}
+        self.extend(iterable)
+
+    def _encode(self, item):
+        # Equal items of different types, like 1 and True, are kept apart
+        key = (type(item), item)
+        try:
+            return self._lookup[key]
+        except KeyError:
+            pass
+        except TypeError:
+            raise TypeError(
+                "items of an encoded list must be hashable, "
+                f"not {type(item).__name__}"
+            )
+        code = self._lookup[key] = len(self._items)
+        self._items.append(item)
+        if code >= 1 << (8 * self._codes.itemsize):
+            typecode = self._TYPECODES[self._TYPECODES.index(self._codes.typecode) + 1]
+            self._codes = array.array(typecode, self._codes)
+        return code
+
+    def _encode_all(self, items):
+        codes = [self._encode(item) for item in items]
+        return array.array(self._codes.typecode, codes)
+
+    @property
+    def distinct(self):
+        """List of the distinct items, in order of first insertion."""
+        return self._items
+
+    def distinct_in_use(self):
+        """Return the distinct items which are currently in the list."""
+        return [self._items[code] for code in set(self._codes)]
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __iter__(self):
+        return map(self._items.__getitem__, self._codes)
+
+    def __contains__(self, item):
+        try:
+            code = self._lookup.get((type(item), item))
+        except TypeError:
+            return False
+        return code is not None and code in self._codes
+
+    def __eq__(self, other):
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, list(self))
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._items[code] for code in self._codes[key]]
+        return self._items[self._codes[key]]
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            self._codes[key] = self._encode_all(value)
+        else:
+            self._codes[key] = self._encode(value)
+
+    def __delitem__(self, key):
+        del self._codes[key]
+
+    def append(self, item):
+        code = self._encode(item)
+        self._codes.append(code)
+
+    def extend(self, items):
+        codes = self._encode_all(items)
+        self._codes.extend(codes)
+
+    def insert(self, index, item):
+        code = self._encode(item)
+        self._codes.insert(index, code)
+
+    def pop(self, index=-1):
+        return self._items[self._codes.pop(index)]
+
+    def remove(self, item):
+        del self[self.index(item)]
+
+    def index(self, item, *args):
+        return list(self).index(item, *args)
+
+    def count(self, item):
+        return list(self).count(item)
+
+    def reverse(self):
+        self._codes.reverse()
+
+    def sort(self, key=None, reverse=False):
+        self[:] = sorted(self, key=key, reverse=reverse)
+
+    def clear(self):
+        self.__init__()
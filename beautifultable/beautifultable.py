@@ -27,9 +27,19 @@ Example
 """
 from __future__ import division, unicode_literals
 
+import io
+import os
 import copy
 import csv
+import mmap
+import array
+import locale
 import warnings
+import operator
+import functools
+import hashlib
+import itertools
+import weakref
 
 from . import enums
 
@@ -42,12 +52,14 @@ from .utils import (
     ensure_type,
 )
 from .compat import basestring, Iterable, to_unicode
-from .base import BTBaseList
+from .base import BTBaseList, BTDequeList, BTEncodedList
 from .helpers import (
+    BTRowData,
     BTRowCollection,
     BTColumnCollection,
     BTRowHeader,
     BTColumnHeader,
+    BTRowGroupBy,
 )
 
 
@@ -58,6 +70,8 @@ __all__ = [
     "BTRowHeader",
     "BTColumnHeader",
     "BTBorder",
+    "BTRowGroupBy",
+    "FrozenBeautifulTable",
 ]
 
 
@@ -179,12 +193,352 @@ for prop, attr in [
     setattr(BTBorder, prop, property(_make_getter(attr), _make_setter(attr)))
 
 
+def _modifies_rows(method):
+    """Decorate a method of a storage which modifies its rows.
+
+    The hash index of the rows and the sorted columns are dropped once the
+    method returns, since the method itself may have used them.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._row_index = None
+            self._sorted_columns = None
+
+    return wrapper
+
+
+def _appends_rows(method):
+    """Decorate a method of a storage which appends rows to it.
+
+    The hash index of the rows and the sorted columns, if built, are
+    updated with the new rows.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        start = len(self)
+        method(self, *args, **kwargs)
+        if self._row_index:
+            self._index_rows(start)
+        elif self._row_index is not False:
+            self._row_index = None
+        if self._sorted_columns:
+            self._extend_sorted_columns(start)
+
+    return wrapper
+
+
+def _make_join_key(indices):
+    """Return a function reading the values at `indices` from a row.
+
+    The function returns None if any of these values is None.
+    """
+    if len(indices) == 1:
+        return operator.itemgetter(indices[0])
+    getter = operator.itemgetter(*indices)
+
+    def key(row):
+        values = getter(row)
+        return None if None in values else values
+
+    return key
+
+
 class BTTableData(BTBaseList):
+    # Type of the list used to store rows and row headers
+    _list_type = list
+
+    # Hash index of the rows, see _index_rows
+    _row_index = None
+
+    # Values of the columns by which the rows are sorted, see _sorted_column
+    _sorted_columns = None
+
     def __init__(self, table, value=None):
-        if value is None:
-            value = []
         self._table = table
-        self._value = value
+        self._value = self._list_type(
+            row._value if isinstance(row, BTRowData) else row for row in value or ()
+        )
+        self._cache = None
+
+    @classmethod
+    def _adopt(cls, table, rows):
+        """Create an instance which reads its rows from `rows` without copying.
+
+        `rows` can be any sequence of rows. Rows are only validated and
+        copied into lists when they are accessed. The sequence is copied
+        into a list once rows are inserted, removed or reordered.
+        """
+        obj = cls(table)
+        obj._value = rows
+        obj._cache = {}
+        return obj
+
+    @staticmethod
+    def _validate_rows(table, rows):
+        """Return an iterator over `rows` which checks the length of each row.
+
+        ValueError is raised for a row whose length differs from the number
+        of columns of `table`.
+        """
+        ncol = table._ncol
+        for row in rows:
+            if len(row) != ncol:
+                raise ValueError(f"'Expected iterable of length {ncol}, got {len(row)}")
+            yield row
+
+    @property
+    def value(self):
+        return list(self)
+
+    def _own(self):
+        """Copy adopted rows into a list owned by this instance."""
+        if self._cache is not None:
+            self._value = self._list_type(
+                self._values(i) for i in range(len(self._value))
+            )
+            self._cache = None
+
+    def _values(self, index):
+        """Return the list of values of the row at the non-negative `index`.
+
+        An adopted row is validated and copied into a list the first time.
+        """
+        if self._cache is None:
+            return self._value[index]
+        try:
+            return self._cache[index]
+        except KeyError:
+            row = BTRowData(self._table, self._value[index])
+            values = self._cache[index] = row._value
+            return values
+
+    def _row(self, index):
+        """Return the row at the non-negative `index`."""
+        return BTRowData._wrap(self._table, self._values(index))
+
+    def _peek(self, index):
+        """Return the values of the row at the non-negative `index`.
+
+        Unlike :meth:`_values`, an adopted row is not validated or copied,
+        hence the result should only be read.
+        """
+        if self._cache is None:
+            return self._value[index]
+        row = self._cache.get(index)
+        return self._value[index] if row is None else row
+
+    def _itervalues(self):
+        """Return an iterator over the values of the rows, to be only read."""
+        if self._cache is None:
+            return iter(self._value)
+        return (self._peek(i) for i in range(len(self._value)))
+
+    def _retarget(self, table):
+        """Attach this instance to `table`.
+
+        Rows are stored as plain lists and only wrapped in a
+        :class:`~.BTRowData` when accessed, so they don't refer to the table.
+        """
+        self._table = table
+
+    def _iterview(self):
+        """Return an iterator over the rows which should only be read.
+
+        Adopted rows are validated on the fly but not stored, so rendering a
+        table doesn't copy all of its adopted rows.
+        """
+        if self._cache is None:
+            return iter(self)
+        table = self._table
+        return (
+            (
+                BTRowData._wrap(table, self._cache[i])
+                if i in self._cache
+                else BTRowData(table, self._value[i])
+            )
+            for i in range(len(self._value))
+        )
+
+    def __iter__(self):
+        if self._cache is None:
+            table = self._table
+            return (BTRowData._wrap(table, row) for row in self._value)
+        return (self._row(i) for i in range(len(self._value)))
+
+    def __repr__(self):
+        class_ = type(self).__name__
+        data = ", ".join(repr(v) for v in self)
+        return "{}<{}>".format(class_, data)
+
+    def _index_rows(self, start=0):
+        """Add the rows from `start` onwards to the hash index of the rows.
+
+        The index maps the values of a row to the position of the first row
+        with those values. It is False if any row can't be hashed.
+        """
+        index = self._row_index if start else {}
+        try:
+            for i in range(start, len(self)):
+                index.setdefault(tuple(self._peek(i)), i)
+        except TypeError:
+            index = False
+        self._row_index = index
+
+    def _find(self, item, start=0, stop=None):
+        """Return the position of the first row equal to `item`, or -1.
+
+        The lookup uses the hash index of the rows, which is built when it
+        is first needed, unless either the rows or `item` can't be hashed.
+        """
+        if not start and stop is None:
+            if self._row_index is None:
+                self._index_rows()
+            if self._row_index is not False:
+                try:
+                    return self._row_index.get(tuple(item), -1)
+                except TypeError:
+                    pass
+        item = list(item)
+        for i in range(len(self))[start:stop]:
+            if list(self._peek(i)) == item:
+                return i
+        return -1
+
+    def __contains__(self, item):
+        return self._find(item) != -1
+
+    def _sorted_column(self, index, check=True):
+        """Return the values of the column at `index`, which must be sorted.
+
+        Values which are None must all be at the end, and are left out. The
+        result is cached until the rows are modified, other than by
+        appending rows in order.
+
+        Raises
+        ------
+        ValueError:
+            If `check` is true and the rows are not sorted by the column.
+        """
+        if self._sorted_columns is None:
+            self._sorted_columns = {}
+        keys = self._sorted_columns.get(index)
+        if keys is None:
+            keys = list(self._column(index))
+            length = len(keys)
+            while length and keys[length - 1] is None:
+                length -= 1
+            del keys[length:]
+            if check and (
+                None in keys
+                or any(map(operator.gt, keys, itertools.islice(keys, 1, None)))
+            ):
+                raise ValueError("rows are not sorted in ascending order of the column")
+            self._sorted_columns[index] = keys
+        return keys
+
+    def _extend_sorted_columns(self, start):
+        """Add the rows from `start` onwards to the sorted columns.
+
+        A column is dropped if these rows are not in order.
+        """
+        for index, keys in list(self._sorted_columns.items()):
+            # Positions from len(keys) to start hold None
+            trailing = len(keys) < start
+            try:
+                for i in range(start, len(self)):
+                    value = self._peek(i)[index]
+                    if value is None:
+                        trailing = True
+                    elif trailing or (keys and value < keys[-1]):
+                        raise ValueError
+                    else:
+                        keys.append(value)
+            except (ValueError, TypeError):
+                del self._sorted_columns[index]
+
+    def __getitem__(self, key):
+        key = self._get_canonical_key(key)
+        indices = range(len(self._value))
+        if isinstance(key, slice):
+            return [self._row(i) for i in indices[key]]
+        return self._row(indices[key])
+
+    @_modifies_rows
+    def __setitem__(self, key, value):
+        key = self._get_canonical_key(key)
+        if isinstance(key, slice):
+            self._own()
+            self._value[key] = [row._value for row in value]
+        elif self._cache is not None:
+            self._cache[range(len(self._value))[key]] = value._value
+        else:
+            self._value[key] = value._value
+
+    @_modifies_rows
+    def __delitem__(self, key):
+        self._own()
+        del self._value[self._get_canonical_key(key)]
+
+    @_appends_rows
+    def _append(self, item):
+        self._own()
+        self._value.append(item._value)
+
+    @_modifies_rows
+    def _insert(self, i, item):
+        self._own()
+        self._value.insert(i, item._value)
+
+    @_appends_rows
+    def _extend(self, rows):
+        """Append `rows`, which are lists of values already validated."""
+        self._own()
+        self._value.extend(rows)
+
+    @_modifies_rows
+    def _pop(self, i=-1):
+        self._own()
+        return BTRowData._wrap(self._table, self._value.pop(self._get_canonical_key(i)))
+
+    @_modifies_rows
+    def _remove(self, item):
+        self._own()
+        del self._value[self.index(item)]
+
+    @_modifies_rows
+    def _reverse(self):
+        self._own()
+        self._value.reverse()
+
+    @_modifies_rows
+    def _permute(self, order):
+        """Reorder the rows, such that the row at `order[i]` moves to `i`.
+
+        Rows whose position is not in `order` are removed.
+        """
+        self._own()
+        value = self._value
+        self._value = self._list_type([value[i] for i in order])
+
+    @_modifies_rows
+    def _clear(self):
+        self._value = self._list_type()
+        self._cache = None
+
+    def count(self, item):
+        item = list(item)
+        return sum(1 for row in self._itervalues() if list(row) == item)
+
+    def index(self, item, *args):
+        index = self._find(item, *args)
+        if index == -1:
+            raise KeyError(f"Key {item} is not available")
+        return index
 
     def _get_canonical_key(self, key):
         return self._table.rows._canonical_key(key)
@@ -192,6 +546,813 @@ class BTTableData(BTBaseList):
     def _get_ideal_length(self):
         pass
 
+    def _column(self, index):
+        """Return the values of the column at `index`."""
+        return [self._peek(i)[index] for i in range(len(self._value))]
+
+    def _itercolumn(self, index):
+        """Return an iterator over the values of the column at `index`."""
+        return (row[index] for row in self._itervalues())
+
+    @_modifies_rows
+    def _set_column(self, key, values):
+        for row, item in zip(self, values):
+            row._value[key] = item
+
+    @_modifies_rows
+    def _insert_column(self, index, column):
+        self._own()
+        for row, item in zip(self._value, column):
+            row.insert(index, item)
+
+    @_modifies_rows
+    def _extend_columns(self, columns):
+        self._own()
+        for row, values in zip(self._value, zip(*columns)):
+            row.extend(values)
+
+    @_modifies_rows
+    def _pop_column(self, index):
+        self._own()
+        return [row.pop(index) for row in self._value]
+
+    @_modifies_rows
+    def _delete_column(self, key):
+        self._own()
+        for row in self._value:
+            del row[key]
+
+    @_modifies_rows
+    def _permute_columns(self, order):
+        """Reorder the columns, such that the column at `order[i]` moves to `i`.
+
+        Columns whose position is not in `order` are removed.
+        """
+        self._own()
+        for row in self._value:
+            row[:] = [row[j] for j in order]
+
+    def _itercolumns(self):
+        """Return an iterator over the columns of the table."""
+        if self._cache is None:
+            return zip(*self._value)
+        if not self._cache and hasattr(self._value, "_itercolumns"):
+            return self._value._itercolumns()
+        return zip(*(self._peek(i) for i in range(len(self._value))))
+
+    def _encode_column(self, index):
+        raise TypeError("encoding columns requires 'STORAGE_COLUMNAR'")
+
+    _decode_column = _encode_column
+
+    def _encoded_columns(self):
+        """Return whether each column is stored as a :class:`~.BTEncodedList`."""
+        return [False] * self._table._ncol
+
+    def _itersample(self):
+        """Return an iterator over the columns considered for column widths.
+
+        An adopted sequence can limit them to its first rows by defining a
+        `_sample_size` attribute. Rows which were accessed are considered
+        as well, since they may have been modified.
+        """
+        size = None
+        if self._cache is not None:
+            size = getattr(self._value, "_sample_size", None)
+        if size is None:
+            return self._itercolumns()
+        indices = set(range(min(size, len(self._value)))).union(self._cache)
+        return zip(*(self._peek(i) for i in sorted(indices)))
+
+
+class BTDequeTableData(BTTableData):
+    """Row-major storage with fast insertion and removal at both ends.
+
+    Rows are stored in a :class:`~.BTDequeList`, so inserting rows at the
+    top of the table is as fast as appending them.
+    """
+
+    _list_type = BTDequeList
+
+
+class BTCSVRows:
+    """Read-only sequence of the records of a memory-mapped CSV file.
+
+    The offsets of all records are indexed once, and a record is parsed
+    only when it is accessed. The index can be persisted next to the file,
+    and is reused as long as the file, the encoding and the format
+    parameters are unchanged, since they decide where records end. Column
+    widths are computed from the first `sample_size` records only. The file
+    should use an ASCII compatible encoding.
+    """
+
+    _INDEX_SUFFIX = ".idx"
+
+    def __init__(
+        self,
+        file_name,
+        header=True,
+        persist_index=False,
+        sample_size=1000,
+        encoding=None,
+        **kwargs,
+    ):
+        self._encoding = encoding or locale.getpreferredencoding(False)
+        self._kwargs = kwargs
+        self._sample_size = sample_size
+        with open(file_name, mode="rb") as csv_file:
+            stat = os.fstat(csv_file.fileno())
+            if stat.st_size:
+                self._mmap = mmap.mmap(csv_file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._mmap = b""
+
+        index_name = file_name + self._INDEX_SUFFIX
+        signature = [stat.st_size, stat.st_mtime_ns, self._get_format_digest()]
+        offsets = self._load_index(index_name, signature) if persist_index else None
+        if offsets is None:
+            offsets = self._build_index()
+            if persist_index:
+                with open(index_name, mode="wb") as index_file:
+                    (array.array("q", signature) + offsets).tofile(index_file)
+        self._offsets = offsets
+
+        self.header = None
+        self._start = 0
+        if header and len(self._offsets) > 1:
+            self.header = self._parse(0)
+            self._start = 1
+
+    @staticmethod
+    def _load_index(index_name, signature):
+        try:
+            with open(index_name, mode="rb") as index_file:
+                offsets = array.array("q")
+                offsets.frombytes(index_file.read())
+        except (OSError, ValueError):
+            return None
+        if list(offsets[: len(signature)]) != signature:
+            return None
+        return offsets[len(signature) :]
+
+    def _get_format_digest(self):
+        """Return a 64-bit digest of the encoding and the csv dialect."""
+        dialect = csv.reader([], **self._kwargs).dialect
+        attributes = [self._encoding] + [
+            getattr(dialect, name)
+            for name in (
+                "delimiter",
+                "doublequote",
+                "escapechar",
+                "lineterminator",
+                "quotechar",
+                "quoting",
+                "skipinitialspace",
+                "strict",
+            )
+        ]
+        digest = hashlib.blake2b(repr(attributes).encode(), digest_size=8)
+        return int.from_bytes(digest.digest(), "little", signed=True)
+
+    def _build_index(self):
+        """Return the offsets at which every record starts, and the file ends.
+
+        Records can span several lines, hence the lines are fed to a csv
+        reader, and a record ends after the last line it consumed. This
+        splits the file exactly like reading it does.
+        """
+        data = self._mmap
+        size = len(data)
+        offsets = array.array("q", [0])
+        position = 0
+
+        def iterlines():
+            nonlocal position
+            while position < size:
+                end = data.find(b"\n", position)
+                end = size if end == -1 else end + 1
+                line = data[position:end]
+                position = end
+                yield line.decode(self._encoding)
+
+        for record in csv.reader(iterlines(), **self._kwargs):
+            offsets.append(position)
+        return offsets
+
+    def _parse(self, record):
+        start, end = self._offsets[record], self._offsets[record + 1]
+        text = self._mmap[start:end].decode(self._encoding)
+        return next(csv.reader(io.StringIO(text, newline=""), **self._kwargs), [])
+
+    def __len__(self):
+        return len(self._offsets) - 1 - self._start
+
+    def __getitem__(self, index):
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("row index out of range")
+        return self._parse(index + self._start)
+
+    def __deepcopy__(self, memo):
+        # The file is never modified through this object, hence copies of a
+        # table can share it.
+        return self
+
+    def close(self):
+        """Close the memory-mapped file.
+
+        Records can't be accessed afterwards, including by copies of a
+        table which share this object.
+        """
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class BTNumpyRows:
+    """Read-only sequence of the rows of a 2-D or structured numpy array.
+
+    Values are converted to python objects only when a row, or a whole
+    column, is requested.
+    """
+
+    def __init__(self, array):
+        self._array = array
+
+    def __len__(self):
+        return len(self._array)
+
+    def __getitem__(self, index):
+        row = self._array[index].tolist()
+        # Rows of a structured array are converted to tuples
+        return row if isinstance(row, list) else list(row)
+
+    def _itercolumns(self):
+        names = self._array.dtype.names
+        if names is not None:
+            return (self._array[name].tolist() for name in names)
+        return (column.tolist() for column in self._array.T)
+
+
+class BTRowView:
+    """Base class for the values of a row which are served by a view.
+
+    The number of values can only be changed through
+    :attr:`.BeautifulTable.columns`.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def _unsupported(self, *args, **kwargs):
+        raise TypeError(
+            f"columns of a table with storage '{self._storage}' can only be "
+            "changed through 'BeautifulTable.columns'"
+        )
+
+    __delitem__ = insert = pop = append = remove = _unsupported
+    clear = reverse = sort = _unsupported
+
+    def count(self, item):
+        return list(self).count(item)
+
+    def index(self, item, *args):
+        return list(self).index(item, *args)
+
+
+class BTColumnarRowValue(BTRowView):
+    """Values of a single row of a :class:`~.BTColumnarTableData`.
+
+    It reads and writes through to the underlying columns.
+    """
+
+    __slots__ = ("_columns", "_index")
+
+    _storage = "STORAGE_COLUMNAR"
+
+    def __init__(self, columns, index):
+        self._columns = columns
+        self._index = index
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __iter__(self):
+        index = self._index
+        return (column[index] for column in self._columns)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [column[self._index] for column in self._columns[key]]
+        return self._columns[key][self._index]
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            columns = self._columns[key]
+            value = list(value)
+            if len(value) != len(columns):
+                raise ValueError(
+                    f"'Expected iterable of length {len(columns)}, got {len(value)}"
+                )
+            for column, item in zip(columns, value):
+                column[self._index] = item
+        else:
+            self._columns[key][self._index] = value
+
+
+class BTColumnarTableData(BTTableData):
+    """Column-major storage for the data of a table.
+
+    Each column is stored as a separate list, hence operations on columns
+    don't need to touch every row. Rows are served as lightweight
+    :class:`~.BTRowData` views over these lists. A view refers to a position
+    in the table, so it should not be held on to while rows are being
+    inserted or removed.
+    """
+
+    def __init__(self, table, value=None):
+        if value is None:
+            value = []
+        self._table = table
+        self._cache = None
+        self._nrow = len(value)
+        ncol = len(value[0]) if value else table._ncol
+        if value and ncol:
+            self._columns = [list(column) for column in zip(*value)]
+        else:
+            self._columns = [[] for i in range(ncol)]
+
+    @classmethod
+    def _adopt(cls, table, rows):
+        """Create an instance from the sequence of rows `rows`.
+
+        The rows are copied into columns right away, hence their lengths
+        are validated here.
+        """
+        obj = cls(table)
+        if hasattr(rows, "_itercolumns"):
+            columns = [list(column) for column in rows._itercolumns()]
+            if len(rows) > 0 and len(columns) != table._ncol:
+                raise ValueError(
+                    f"'Expected iterable of length {table._ncol}, got {len(columns)}"
+                )
+        else:
+            columns = [list(column) for column in zip(*cls._validate_rows(table, rows))]
+        if len(rows) > 0:
+            obj._columns[:] = columns
+        obj._nrow = len(rows)
+        return obj
+
+    def _view(self, index):
+        return BTRowData._wrap(self._table, BTColumnarRowValue(self._columns, index))
+
+    def _peek(self, index):
+        return BTColumnarRowValue(self._columns, index)
+
+    def _itervalues(self):
+        if not self._columns:
+            return iter([()] * self._nrow)
+        return zip(*self._columns)
+
+    def _normalize(self, index):
+        if index < 0:
+            index += self._nrow
+        if not 0 <= index < self._nrow:
+            raise IndexError("row index out of range")
+        return index
+
+    def __len__(self):
+        return self._nrow
+
+    def __iter__(self):
+        return (self._view(i) for i in range(self._nrow))
+
+    def __getitem__(self, key):
+        key = self._get_canonical_key(key)
+        if isinstance(key, slice):
+            return [self._view(i) for i in range(self._nrow)[key]]
+        return self._view(self._normalize(key))
+
+    def _encode_rows(self, rows):
+        """Encode the values of `rows` which belong to encoded columns.
+
+        This is done before storing `rows`, so that an unhashable value is
+        reported before any column is modified.
+        """
+        for j, column in enumerate(self._columns):
+            if isinstance(column, BTEncodedList):
+                for row in rows:
+                    column._encode(row[j])
+
+    @_modifies_rows
+    def __setitem__(self, key, value):
+        key = self._get_canonical_key(key)
+        if isinstance(key, slice):
+            value = list(value)
+            self._encode_rows([row._value for row in value])
+            length = len(range(self._nrow)[key])
+            for j, column in enumerate(self._columns):
+                column[key] = [row._value[j] for row in value]
+            self._nrow += len(value) - length
+        else:
+            index = self._normalize(key)
+            self._encode_rows([value._value])
+            for column, item in zip(self._columns, value._value):
+                column[index] = item
+
+    @_modifies_rows
+    def __delitem__(self, key):
+        key = self._get_canonical_key(key)
+        if isinstance(key, slice):
+            length = len(range(self._nrow)[key])
+        else:
+            key = self._normalize(key)
+            length = 1
+        for column in self._columns:
+            del column[key]
+        self._nrow -= length
+
+    @_appends_rows
+    def _append(self, item):
+        self._encode_rows([item._value])
+        for column, value in zip(self._columns, item._value):
+            column.append(value)
+        self._nrow += 1
+
+    @_modifies_rows
+    def _insert(self, i, item):
+        self._encode_rows([item._value])
+        for column, value in zip(self._columns, item._value):
+            column.insert(i, value)
+        self._nrow += 1
+
+    @_appends_rows
+    def _extend(self, rows):
+        self._encode_rows(rows)
+        for column, column_values in zip(self._columns, zip(*rows)):
+            column.extend(column_values)
+        self._nrow += len(rows)
+
+    @_modifies_rows
+    def _pop(self, i=-1):
+        index = self._normalize(self._get_canonical_key(i))
+        values = [column.pop(index) for column in self._columns]
+        self._nrow -= 1
+        return BTRowData._wrap(self._table, values)
+
+    @_modifies_rows
+    def _remove(self, item):
+        del self[self.index(item)]
+
+    @_modifies_rows
+    def _reverse(self):
+        for column in self._columns:
+            column.reverse()
+
+    @_modifies_rows
+    def _permute(self, order):
+        for column in self._columns:
+            column[:] = [column[i] for i in order]
+        self._nrow = len(order)
+
+    @_modifies_rows
+    def _clear(self):
+        for column in self._columns:
+            column.clear()
+        self._nrow = 0
+
+    def count(self, item):
+        return sum(1 for row in self if row == item)
+
+    def _column(self, index):
+        return self._columns[index]
+
+    def _itercolumn(self, index):
+        return iter(self._columns[index])
+
+    @_modifies_rows
+    def _set_column(self, key, values):
+        if isinstance(key, slice):
+            return super(BTColumnarTableData, self)._set_column(key, values)
+        values = list(values)[: self._nrow]
+        self._columns[key][: len(values)] = values
+
+    @_modifies_rows
+    def _insert_column(self, index, column):
+        self._columns.insert(index, list(column))
+
+    @_modifies_rows
+    def _extend_columns(self, columns):
+        self._columns.extend(list(column) for column in columns)
+
+    @_modifies_rows
+    def _pop_column(self, index):
+        return self._columns.pop(index)
+
+    @_modifies_rows
+    def _delete_column(self, key):
+        del self._columns[key]
+
+    @_modifies_rows
+    def _permute_columns(self, order):
+        # Row views refer to this list, so it is updated in place
+        self._columns[:] = [self._columns[j] for j in order]
+
+    def _itercolumns(self):
+        return iter(self._columns)
+
+    def _encode_column(self, index):
+        self._columns[index] = BTEncodedList(self._columns[index])
+
+    def _decode_column(self, index):
+        self._columns[index] = list(self._columns[index])
+
+    def _encoded_columns(self):
+        return [isinstance(column, BTEncodedList) for column in self._columns]
+
+
+class BTSparseRowValue(BTRowView):
+    """Values of a single row of a :class:`~.BTSparseTableData`.
+
+    It reads and writes through to the dict of non-empty cells of the row.
+    """
+
+    __slots__ = ("_cells", "_ncol")
+
+    _storage = "STORAGE_SPARSE"
+
+    def __init__(self, cells, ncol):
+        self._cells = cells
+        self._ncol = ncol
+
+    def __len__(self):
+        return self._ncol
+
+    def __iter__(self):
+        return map(self._cells.get, range(self._ncol))
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._cells.get(j) for j in range(self._ncol)[key]]
+        return self._cells.get(range(self._ncol)[key])
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            indices = range(self._ncol)[key]
+            value = list(value)
+            if len(value) != len(indices):
+                raise ValueError(
+                    f"'Expected iterable of length {len(indices)}, got {len(value)}"
+                )
+        else:
+            indices, value = [range(self._ncol)[key]], [value]
+        for j, item in zip(indices, value):
+            if item is None:
+                self._cells.pop(j, None)
+            else:
+                self._cells[j] = item
+
+
+class BTSparseTableData(BTTableData):
+    """Storage for the data of a table which only keeps non-empty cells.
+
+    Each row is stored as a dict which maps the index of a column to the
+    value of the cell, for cells which are not None. Rows are served as
+    lightweight :class:`~.BTRowData` views over these dicts. Like the
+    columnar storage, views should not be held on to while columns are
+    being inserted or removed.
+    """
+
+    def __init__(self, table, value=None):
+        if value is None:
+            value = []
+        self._table = table
+        self._cache = None
+        self._rows = [self._compress(row) for row in value]
+
+    @staticmethod
+    def _compress(values):
+        return {j: item for j, item in enumerate(values) if item is not None}
+
+    @classmethod
+    def _adopt(cls, table, rows):
+        """Create an instance from the sequence of rows `rows`.
+
+        The rows are compressed into dicts right away, hence their lengths
+        are validated here.
+        """
+        return cls(table, cls._validate_rows(table, rows))
+
+    def _view(self, index):
+        return BTRowData._wrap(
+            self._table, BTSparseRowValue(self._rows[index], self._table._ncol)
+        )
+
+    def _peek(self, index):
+        return BTSparseRowValue(self._rows[index], self._table._ncol)
+
+    def _itervalues(self):
+        ncol = self._table._ncol
+        return (BTSparseRowValue(row, ncol) for row in self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        return (self._view(i) for i in range(len(self._rows)))
+
+    def __getitem__(self, key):
+        key = self._get_canonical_key(key)
+        indices = range(len(self._rows))
+        if isinstance(key, slice):
+            return [self._view(i) for i in indices[key]]
+        return self._view(indices[key])
+
+    @_modifies_rows
+    def __setitem__(self, key, value):
+        key = self._get_canonical_key(key)
+        if isinstance(key, slice):
+            self._rows[key] = [self._compress(row._value) for row in value]
+        else:
+            self._rows[key] = self._compress(value._value)
+
+    @_modifies_rows
+    def __delitem__(self, key):
+        del self._rows[self._get_canonical_key(key)]
+
+    @_appends_rows
+    def _append(self, item):
+        self._rows.append(self._compress(item._value))
+
+    @_modifies_rows
+    def _insert(self, i, item):
+        self._rows.insert(i, self._compress(item._value))
+
+    @_appends_rows
+    def _extend(self, rows):
+        self._rows.extend(self._compress(row) for row in rows)
+
+    @_modifies_rows
+    def _pop(self, i=-1):
+        row = self[i]
+        del self._rows[self._get_canonical_key(i)]
+        return BTRowData._wrap(self._table, list(row._value))
+
+    @_modifies_rows
+    def _remove(self, item):
+        del self._rows[self.index(item)]
+
+    @_modifies_rows
+    def _reverse(self):
+        self._rows.reverse()
+
+    @_modifies_rows
+    def _permute(self, order):
+        rows = self._rows
+        self._rows = [rows[i] for i in order]
+
+    @_modifies_rows
+    def _clear(self):
+        self._rows.clear()
+
+    def count(self, item):
+        return sum(1 for row in self if row == item)
+
+    def _remap(self, mapping):
+        """Move cells from column `j` to column `mapping[j]`, or drop them if None."""
+        self._rows = [
+            {mapping[j]: item for j, item in row.items() if mapping[j] is not None}
+            for row in self._rows
+        ]
+
+    def _column(self, index):
+        index = range(self._table._ncol)[index]
+        return [row.get(index) for row in self._rows]
+
+    def _itercolumn(self, index):
+        return (row.get(index) for row in self._rows)
+
+    @_modifies_rows
+    def _set_column(self, key, values):
+        if isinstance(key, slice):
+            return super(BTSparseTableData, self)._set_column(key, values)
+        key = range(self._table._ncol)[key]
+        for row, item in zip(self._rows, values):
+            if item is None:
+                row.pop(key, None)
+            else:
+                row[key] = item
+
+    @_modifies_rows
+    def _insert_column(self, index, column):
+        ncol = self._table._ncol
+        # Same bounds as list.insert
+        index = min(max(index + ncol if index < 0 else index, 0), ncol)
+        self._remap([j if j < index else j + 1 for j in range(ncol)])
+        for row, item in zip(self._rows, column):
+            if item is not None:
+                row[index] = item
+
+    @_modifies_rows
+    def _extend_columns(self, columns):
+        ncol = self._table._ncol
+        for j, column in enumerate(columns, start=ncol):
+            for row, item in zip(self._rows, column):
+                if item is not None:
+                    row[j] = item
+
+    @_modifies_rows
+    def _pop_column(self, index):
+        column = self._column(index)
+        self._delete_column(index)
+        return column
+
+    @_modifies_rows
+    def _delete_column(self, key):
+        indices = range(self._table._ncol)
+        deleted = set(indices[key]) if isinstance(key, slice) else {indices[key]}
+        mapping, shift = [], 0
+        for j in indices:
+            if j in deleted:
+                mapping.append(None)
+                shift += 1
+            else:
+                mapping.append(j - shift)
+        self._remap(mapping)
+
+    @_modifies_rows
+    def _permute_columns(self, order):
+        mapping = [None] * self._table._ncol
+        for i, j in enumerate(order):
+            mapping[j] = i
+        self._remap(mapping)
+
+    def _itercolumns(self):
+        return (self._column(j) for j in range(self._table._ncol))
+
+
+class BTPrefixedTableData:
+    """Read-only view of the rows of a storage, preceded by extra columns.
+
+    This is used to render serial numbers and row headers as leading
+    columns of a copy of the table, without inserting them into its storage.
+    """
+
+    def __init__(self, table, data, columns):
+        self._table = table
+        self._data = data
+        self._columns = columns
+
+    @property
+    def _table(self):
+        return self._table_ref()
+
+    @_table.setter
+    def _table(self, value):
+        self._table_ref = weakref.ref(value)
+
+    def __len__(self):
+        return len(self._data)
+
+    def _prefix(self, index, values):
+        """Return `values` preceded by the extra columns of the row at `index`."""
+        return [column[index] for column in self._columns] + list(values)
+
+    def _iterview(self):
+        table = self._table
+        return (
+            BTRowData._wrap(table, self._prefix(i, row))
+            for i, row in enumerate(self._data._iterview())
+        )
+
+    def _itersample(self):
+        return itertools.chain(self._columns, self._data._itersample())
+
+    def _encoded_columns(self):
+        return [False] * len(self._columns) + self._data._encoded_columns()
+
+
+_STORAGE_TYPES = {
+    enums.STORAGE_ROW: BTTableData,
+    enums.STORAGE_COLUMNAR: BTColumnarTableData,
+    enums.STORAGE_DEQUE: BTDequeTableData,
+    enums.STORAGE_SPARSE: BTSparseTableData,
+}
+
 
 class BeautifulTable:
     """Utility Class to print data in tabular format to terminal.
@@ -227,6 +1388,10 @@ class BeautifulTable:
         Parameter to control how signs in numeric data are displayed.
         (default beautifultable.SM_MINUS).
 
+    storage : Storage, optional
+        Layout used to store the data of the table.
+        (default beautifultable.STORAGE_ROW).
+
     Attributes
     ----------
     precision : int
@@ -252,6 +1417,7 @@ class BeautifulTable:
         serialno_header="SN",
         detect_numerics=True,
         sign=enums.SM_MINUS,
+        storage=enums.STORAGE_ROW,
         **kwargs,
     ):
 
@@ -276,10 +1442,12 @@ class BeautifulTable:
         self.maxwidth = maxwidth
 
         self._ncol = 0
+        self._storage = enums.STORAGE_ROW
         self._data = BTTableData(self)
 
         self.rows = BTRowCollection(self)
         self.columns = BTColumnCollection(self, default_alignment, default_padding)
+        self.storage = storage
 
         self._header_separator = ""
         self._header_junction = ""
@@ -302,12 +1470,25 @@ class BeautifulTable:
         obj.columns.padding_left._table = obj
         obj.columns.padding_right._table = obj
 
-        obj._data._table = obj
-        for row in obj._data:
-            row._table = obj
+        obj._data._retarget(obj)
 
         return obj
 
+    def _copy_without_rows(self):
+        """Return a deep copy of the table without any of its rows.
+
+        This is used to create tables from some of the rows of this table,
+        without paying for copying the others.
+        """
+        data, header = self._data, self.rows.header
+        self._data = type(data)(self)
+        self.rows.header = []
+        try:
+            return copy.deepcopy(self)
+        finally:
+            self._data = data
+            self.rows._header = header
+
     def __deepcopy__(self, memo):
         obj = type(self)()
         obj.__dict__.update(
@@ -324,9 +1505,7 @@ class BeautifulTable:
         obj.columns.padding_left._table = obj
         obj.columns.padding_right._table = obj
 
-        obj._data._table = obj
-        for row in obj._data:
-            row._table = obj
+        obj._data._retarget(obj)
 
         return obj
 
@@ -438,6 +1617,46 @@ class BeautifulTable:
             raise ValueError(error_msg)
         self._sign = value
 
+    @property
+    def storage(self):
+        """Attribute to control how the data of the table is stored.
+
+        It can be one of the following:
+
+        ================================  =====================================
+         Option                            Meaning
+        ================================  =====================================
+         beautifultable.STORAGE_ROW        Data is stored as a list of rows.
+
+         beautifultable.STORAGE_COLUMNAR   Data is stored as a list of columns.
+                                           Operations on columns are faster,
+                                           and rows are served as views over
+                                           the columns.
+
+         beautifultable.STORAGE_DEQUE      Data is stored as a list of rows
+                                           which allows fast insertion and
+                                           removal of rows at both ends.
+
+         beautifultable.STORAGE_SPARSE     Only cells which are not None are
+                                           stored, as a dict for each row.
+                                           This saves memory for tables which
+                                           are mostly empty.
+        ================================  =====================================
+        """
+        return self._storage
+
+    @storage.setter
+    def storage(self, value):
+        if not isinstance(value, enums.Storage):
+            allowed = (f"{type(self).__name__}.{i.name}" for i in enums.Storage)
+            error_msg = "allowed values for storage are: " + ", ".join(allowed)
+            raise ValueError(error_msg)
+        if value is not self._storage:
+            rows = [BTRowData(self, row) for row in self._data]
+            self._data = _STORAGE_TYPES[value](self, rows)
+            self._storage = value
+            self.rows.header = list(self.rows.header)
+
     @property
     def border(self):
         """Characters used to draw the border of the table.
@@ -804,9 +2023,15 @@ class BeautifulTable:
                 max_length = max(max_length, termwidth(output_str))
             maxwidths[index] += max_length
 
-        for index, column in enumerate(zip(*self._data)):
+        for index, column in enumerate(self._data._itersample()):
             max_length = maxwidths[index]
+            if isinstance(column, BTEncodedList):
+                # Measure every distinct value which is in use only once
+                column = column.distinct_in_use()
             for i in column:
+                if i is None:
+                    # Empty cells never widen a column
+                    continue
                 for j in pre_process(
                     i, self.detect_numerics, self.precision, self.sign.value
                 ).split("\n"):
@@ -873,6 +2098,101 @@ class BeautifulTable:
     def copy(self):
         return copy.copy(self)
 
+    def join(self, other, on, how="inner"):
+        """Return a new table joining the rows of this table with the rows
+        of `other` which have equal values in the columns `on`.
+
+        The rows of the smaller table are hashed by their values of `on`,
+        and the other table is scanned once for matching rows. The joined
+        rows are appended to the new table in a single step. Rows follow the
+        order of this table, and matches follow the order of `other`. Rows
+        whose value of `on` is None don't match any row.
+
+        Parameters
+        ----------
+        other : BeautifulTable
+            Table to join with.
+        on : str or list of str
+            Header of the column, or a list of them, present in both tables.
+        how : {'inner', 'left'}
+            If 'inner', rows of this table without a match are left out. If
+            'left', they are kept, with None in the columns of `other`.
+
+        Returns
+        -------
+        BeautifulTable:
+            Table with the style and row headers of this table, and its
+            columns followed by the other columns of `other`. Every column
+            keeps its alignment, padding and width. Widths are computed
+            automatically only if they are for this table.
+
+        Raises
+        ------
+        KeyError:
+            If a column of `on` is missing from either table.
+
+        ValueError:
+            If `how` is neither 'inner' nor 'left'.
+        """
+        if how not in ("inner", "left"):
+            raise ValueError("'how' must be either 'inner' or 'left'")
+        keys = [on] if isinstance(on, basestring) else list(on)
+        left_key = _make_join_key([self.columns.header.index(key) for key in keys])
+        right_indices = [other.columns.header.index(key) for key in keys]
+        right_key = _make_join_key(right_indices)
+        right_columns = [j for j in range(other._ncol) if j not in right_indices]
+
+        left_rows = list(self._data._itervalues())
+        right_rows = list(other._data._itervalues())
+        index = {}
+        if len(left_rows) <= len(right_rows):
+            for i, row in enumerate(left_rows):
+                key = left_key(row)
+                if key is not None:
+                    index.setdefault(key, []).append(i)
+            matches = [[] for row in left_rows]
+            for row in right_rows:
+                for i in index.get(right_key(row), ()):
+                    matches[i].append(row)
+        else:
+            for row in right_rows:
+                key = right_key(row)
+                if key is not None:
+                    index.setdefault(key, []).append(row)
+            matches = [index.get(left_key(row), ()) for row in left_rows]
+
+        rows, header = [], []
+        missing = [None] * len(right_columns)
+        for row, matched, heading in zip(left_rows, matches, self.rows.header):
+            if matched:
+                for match in matched:
+                    rows.append(list(row) + [match[j] for j in right_columns])
+                    header.append(heading)
+            elif how == "left":
+                rows.append(list(row) + missing)
+                header.append(heading)
+
+        table = self._copy_without_rows()
+        columns = table.columns
+        columns.extend(
+            [[] for j in right_columns],
+            header=[other.columns.header[j] for j in right_columns],
+        )
+        for i, j in enumerate(right_columns, self._ncol):
+            columns.alignment[i] = other.columns.alignment[j]
+            columns.padding_left[i] = other.columns.padding_left[j]
+            columns.padding_right[i] = other.columns.padding_right[j]
+            columns.width[i] = other.columns.width[j]
+        if (
+            self.columns.header.alignment is not None
+            or other.columns.header.alignment is not None
+        ):
+            left = self.columns.header.alignment or self.columns.alignment
+            right = other.columns.header.alignment or other.columns.alignment
+            columns.header.alignment = list(left) + [right[j] for j in right_columns]
+        table.rows.extend(rows, header=header)
+        return table
+
     @deprecated_param("1.0.0", "1.2.0", "clear_metadata", "reset_columns")
     def clear(self, reset_columns=False, **kwargs):  # pragma: no cover
         """Clear the contents of the table.
@@ -1045,82 +2365,86 @@ class BeautifulTable:
             "".join(x if x is not None else "" for x in self.columns.header).strip()
         ) and (len(self.rows) > 0 or rows is not None)
 
-        # Preparing table for printing serialno, row headers and column headers
-        if len(self.columns) > 0:
-            if self._serialno:
-                self.columns.insert(
-                    0, range(1, len(self.rows) + 1), self._serialno_header
-                )
-
+        # Preparing serialno and row headers as leading columns
+        serialno = self._serialno and len(self.columns) > 0
+        prefix = []
         if row_header_visible:
-            self.columns.insert(0, self.rows.header)
-
-        if column_header_visible:
-            self.rows.insert(0, self.columns.header)
+            prefix.append((list(self.rows.header), None))
+        if serialno:
+            prefix.append((range(1, len(self.rows) + 1), self._serialno_header))
+
+        # They are rendered by a copy of the table without any rows, which
+        # reads the rows of this table, so that its storage is left untouched
+        table = self
+        if prefix:
+            table = self._copy_without_rows()
+            for column, header in reversed(prefix):
+                table.columns.insert(0, (), header)
+            table._data = BTPrefixedTableData(
+                table, self._data, [column for column, header in prefix]
+            )
 
-        if (self.columns._auto_width and recalculate_width) or sum(
-            self.columns.width
+        if (table.columns._auto_width and recalculate_width) or sum(
+            table.columns.width
         ) == 0:
-            self._compute_width()
+            table._compute_width()
+            if table is not self:
+                self._maxwidth = table._maxwidth
+                self.columns.width._value[:] = table.columns.width[len(prefix) :]
 
-        try:
-            # Rendering the top border
-            if self.border.top:
-                yield self._get_top_border()
-
-            # Print column headers if not empty or only spaces
-            row_iterator = iter(self.rows)
-            if column_header_visible:
-                yield next(row_iterator)._get_string(
-                    align=self.columns.header.alignment
-                )
-                if self.columns.header.separator:
-                    yield self._get_header_separator()
-
-            # Printing rows
-            first_row_encountered = False
-            for i, row in enumerate(row_iterator):
-                if first_row_encountered and self.rows.separator:
-                    yield self._get_row_separator()
-                first_row_encountered = True
-                content = to_unicode(row)
-                yield content
+        # Rendered cells are memoized by their value for encoded columns, and
+        # empty cells are memoized for every column
+        cache = [{} for i in range(len(table.columns))]
+        memoize = table._data._encoded_columns()
 
-            if rows is not None:
-                # Printing additional rows
-                prev_length = len(self.rows)
-                for i, row in enumerate(rows, start=1):
-                    if first_row_encountered and self.rows.separator:
-                        yield self._get_row_separator()
-                    first_row_encountered = True
-                    if self._serialno:
-                        row.insert(0, prev_length + i)
-                    if row_header_visible:
-                        self.rows.append([None] + list(row))
-                    else:
-                        self.rows.append(row)
-                    content = to_unicode(self.rows[-1])
-                    if not append:
-                        self.rows.pop()
-                    yield content
-
-            # Rendering the bottom border
-            if self.border.bottom:
-                yield self._get_bottom_border()
-        except Exception:
-            raise
-        finally:
-            # Cleanup
-            if column_header_visible:
-                self.rows.pop(0)
+        # Rendering the top border
+        if table.border.top:
+            yield table._get_top_border()
 
-            if row_header_visible:
-                self.columns.pop(0)
+        # Print column headers if not empty or only spaces
+        if column_header_visible:
+            yield BTRowData(table, table.columns.header)._get_string(
+                align=table.columns.header.alignment
+            )
+            if table.columns.header.separator:
+                yield table._get_header_separator()
+
+        # Printing rows
+        first_row_encountered = False
+        row_separator = None
+        for i, row in enumerate(table._data._iterview()):
+            if first_row_encountered and table.rows.separator:
+                # The separator is the same between any two rows
+                if row_separator is None:
+                    row_separator = table._get_row_separator()
+                yield row_separator
+            first_row_encountered = True
+            content = row._get_string(cache=cache, memoize=memoize)
+            yield content
+
+        if rows is not None:
+            # Printing additional rows
+            prev_length = len(self.rows)
+            for i, row in enumerate(rows, start=1):
+                if first_row_encountered and table.rows.separator:
+                    yield table._get_row_separator()
+                first_row_encountered = True
+                if append:
+                    self.rows.append(row)
+                    row = self.rows[-1]
+                row = list(row)
+                if serialno:
+                    row.insert(0, prev_length + i)
+                if row_header_visible:
+                    row.insert(0, None)
+                content = BTRowData(table, row)._get_string(
+                    cache=cache, memoize=memoize
+                )
+                yield content
 
-            if len(self.columns) > 0:
-                if self._serialno:
-                    self.columns.pop(0)
-        return
+        # Rendering the bottom border
+        if table.border.bottom:
+            yield table._get_bottom_border()
 
     def stream(self, rows, append=False):
         """Get a generator for the table.
@@ -1172,7 +2496,9 @@ class BeautifulTable:
                 csv_writer.writerow(self.columns.header)
             csv_writer.writerows(self.rows)
 
-    def from_csv(self, file_name, header=True, **kwargs):
+    def from_csv(
+        self, file_name, header=True, lazy=False, persist_index=False, **kwargs
+    ):
         """Create table from CSV file.
 
         Parameters
@@ -1181,11 +2507,26 @@ class BeautifulTable:
             Path to CSV file.
         header : bool, optional
             Whether First row in CSV file should be parsed as table header.
+        lazy : bool, optional
+            If True, the file is memory-mapped instead of being read, and
+            records are parsed only when they are accessed or rendered.
+            Column widths are computed from the first 1000 records. This is
+            useful for files larger than the available memory, for example
+            to display a slice of it with ``table.rows[start:stop]``.
+            Inserting, removing or reordering rows reads the whole file.
+            Unlike reading the file, which appends its records to the
+            existing rows, the table must not have any rows. The file stays
+            mapped while the table reads from it.
+        persist_index : bool, optional
+            If True, the index of record offsets built for a lazy table is
+            saved next to the file, with an additional '.idx' suffix, and
+            reused while the file is unchanged.
 
         Raises
         ------
         ValueError
-            If `file_name` is not str type.
+            If `file_name` is not str type, or if `lazy` is True and the
+            table has rows.
         FileNotFoundError
             If `file_name` is not valid path to file.
         """
@@ -1195,13 +2536,25 @@ class BeautifulTable:
                 f"Expected 'file_name' to be string, got {type(file_name).__name__}"
             )
 
+        if lazy:
+            if len(self.rows) > 0:
+                raise ValueError("'lazy' requires a table without rows")
+            rows = BTCSVRows(file_name, header, persist_index, **kwargs)
+            try:
+                if rows.header is not None:
+                    self.columns.header = rows.header
+                self.rows.adopt(rows)
+            except Exception:
+                rows.close()
+                raise
+            return self
+
         with open(file_name, mode="rt", newline="") as csv_file:
             csv_reader = csv.reader(csv_file, **kwargs)
 
             if header:
                 self.columns.header = next(csv_reader)
-            for row in csv_reader:
-                self.rows.append(row)
+            self.rows.extend(csv_reader)
             return self
 
     def to_df(self):
@@ -1252,10 +2605,171 @@ class BeautifulTable:
         # Index of dataframe will act as a row headers
         row_header = list(df.index)
 
-        for header in headers:
-            self.columns.append(
-                [data[header][indx] for indx in row_header], header=str(header)
-            )
+        self.columns.extend(
+            [[data[header][indx] for indx in row_header] for header in headers],
+            header=[str(header) for header in headers],
+        )
 
         self.rows.header = row_header
         return self
+
+    def from_columns(self, columns):
+        """Import table from a mapping of column headers to columns.
+
+        The columns are appended to the table in a single pass, as with
+        :meth:`.BTColumnCollection.extend`.
+
+        Parameters
+        ----------
+        columns : mapping
+            Mapping from the header of each column to any iterable of its
+            values.
+        """
+        self.columns.extend(columns.values(), header=columns.keys())
+        return self
+
+    def from_numpy(self, array, headers=None):
+        """Import table from a numpy array.
+
+        The array is not copied. Its values are converted to python objects
+        only when a row is accessed or rendered, or when column widths are
+        computed, which is done one column at a time. Existing data of the
+        table is discarded.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            2-D array, or 1-D structured or record array.
+        headers : iterable of str, optional
+            Headers of the columns. Defaults to the field names of a
+            structured array.
+
+        Raises
+        ------
+        ValueError
+            If `array` is neither 2-D nor a 1-D structured array.
+        """
+        names = array.dtype.names
+        if names is not None and array.ndim == 1:
+            ncol = len(names)
+        elif names is None and array.ndim == 2:
+            ncol = array.shape[1]
+        else:
+            raise ValueError(
+                "Expected a 2-D array or a 1-D structured array, "
+                f"got a {array.ndim}-D array"
+            )
+
+        self.rows.clear()
+        self.columns._reset_state(ncol)
+        self.rows.adopt(BTNumpyRows(array))
+
+        if headers is None and names is not None:
+            headers = [str(name) for name in names]
+        if headers is not None:
+            self.columns.header = headers
+        return self
+
+    def freeze(self):
+        """Return an immutable snapshot of the table.
+
+        The table is rendered once and the resulting lines, column widths
+        and data are stored in a :class:`~.FrozenBeautifulTable`. Further
+        changes to this table do not affect the snapshot.
+
+        Returns
+        -------
+        FrozenBeautifulTable:
+            Frozen snapshot of the BeautifulTable instance.
+        """
+        return FrozenBeautifulTable(self)
+
+
+class FrozenBeautifulTable:
+    """Immutable, pre-rendered snapshot of a :class:`~.BeautifulTable`.
+
+    Instances should be created using :meth:`.BeautifulTable.freeze`. All
+    layout computations are done once at creation time, so rendering is
+    just returning the stored string. Instances are hashable, safe to
+    render concurrently from multiple threads, and copying them is free.
+    """
+
+    __slots__ = ("_header", "_row_header", "_data", "_width", "_lines", "_string")
+
+    def __init__(self, table):
+        if len(table.rows) == 0 or len(table.columns) == 0:
+            lines = ()
+        else:
+            lines = tuple(table._get_string([], append=False))
+        _set = super(FrozenBeautifulTable, self).__setattr__
+        _set("_header", tuple(table.columns.header))
+        _set("_row_header", tuple(table.rows.header))
+        _set("_data", tuple(tuple(row) for row in table._data))
+        _set("_width", tuple(table.columns.width))
+        _set("_lines", lines)
+        _set("_string", "\n".join(lines))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __hash__(self):
+        # Cells may be unhashable, hence only the rendered string and
+        # headers take part in the hash.
+        return hash((self._string, self._header, self._row_header))
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenBeautifulTable):
+            return NotImplemented
+        return (
+            self._string == other._string
+            and self._header == other._header
+            and self._row_header == other._row_header
+            and self._data == other._data
+        )
+
+    def __repr__(self):
+        return "{}<{}>".format(
+            type(self).__name__, ", ".join(repr(list(row)) for row in self._data)
+        )
+
+    def __str__(self):
+        return self._string
+
+    @property
+    def shape(self):
+        """Read only attribute which returns the shape of the table."""
+        return (len(self._data), len(self._header))
+
+    @property
+    def rows(self):
+        """Tuple containing the rows of the table as tuples."""
+        return self._data
+
+    @property
+    def header(self):
+        """Tuple containing the headings of the columns of the table."""
+        return self._header
+
+    @property
+    def row_header(self):
+        """Tuple containing the headings of the rows of the table."""
+        return self._row_header
+
+    @property
+    def width(self):
+        """Tuple containing the width of the columns of the table."""
+        return self._width
+
+    @property
+    def lines(self):
+        """Tuple containing the rendered lines of the table."""
+        return self._lines
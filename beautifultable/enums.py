@@ -44,6 +44,16 @@ class Alignment(enum.Enum):
         return self.name
 
 
+class Storage(enum.Enum):
+    STORAGE_ROW = 1
+    STORAGE_COLUMNAR = 2
+    STORAGE_DEQUE = 3
+    STORAGE_SPARSE = 4
+
+    def __repr__(self):
+        return self.name
+
+
 class Style(enum.Enum):
     STYLE_DEFAULT = DefaultStyle
     STYLE_NONE = NoStyle
@@ -71,6 +81,10 @@ SM_SPACE = SignMode.SM_SPACE
 ALIGN_LEFT = Alignment.ALIGN_LEFT
 ALIGN_CENTER = Alignment.ALIGN_CENTER
 ALIGN_RIGHT = Alignment.ALIGN_RIGHT
+STORAGE_ROW = Storage.STORAGE_ROW
+STORAGE_COLUMNAR = Storage.STORAGE_COLUMNAR
+STORAGE_DEQUE = Storage.STORAGE_DEQUE
+STORAGE_SPARSE = Storage.STORAGE_SPARSE
 STYLE_DEFAULT = Style.STYLE_DEFAULT
 STYLE_NONE = Style.STYLE_NONE
 STYLE_DOTTED = Style.STYLE_DOTTED
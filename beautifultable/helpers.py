@@ -1,6 +1,10 @@
 import copy
+import heapq
+import bisect
+import collections
 import weakref
 import operator
+import itertools
 
 from . import enums
 from .base import BTBaseRow, BTBaseColumn
@@ -9,11 +13,98 @@ from .compat import basestring, Iterable, to_unicode, zip_longest
 from .meta import AlignmentMetaData, NonNegativeIntegerMetaData
 
 
-class BTRowHeader(BTBaseColumn):
+class BTHeaderIndexMixin:
+    """Lookup of headings through a lazily built dictionary.
+
+    The dictionary maps every heading to the position of its first
+    occurrence. It is discarded whenever the header is modified.
+    """
+
+    _positions = None
+
+    @property
+    def value(self):
+        # The header can be modified through the returned list
+        self._positions = None
+        return self._value
+
+    def _get_positions(self):
+        if self._positions is None:
+            positions = {}
+            for i, item in enumerate(self._value):
+                positions.setdefault(item, i)
+            self._positions = positions
+        return self._positions
+
+    def __contains__(self, item):
+        try:
+            return item in self._get_positions()
+        except TypeError:
+            return False
+
+    def index(self, item, *args):
+        """Returns the index of `item`"""
+        if args:
+            return super(BTHeaderIndexMixin, self).index(item, *args)
+        try:
+            return self._get_positions()[item]
+        except (KeyError, TypeError):
+            raise KeyError(f"Key {item} is not available")
+
+    def __setitem__(self, key, value):
+        super(BTHeaderIndexMixin, self).__setitem__(key, value)
+        self._positions = None
+
+    def __delitem__(self, key):
+        super(BTHeaderIndexMixin, self).__delitem__(key)
+        self._positions = None
+
+    def _append(self, item):
+        super(BTHeaderIndexMixin, self)._append(item)
+        self._positions = None
+
+    def _insert(self, i, item):
+        super(BTHeaderIndexMixin, self)._insert(i, item)
+        self._positions = None
+
+    def _extend(self, items):
+        super(BTHeaderIndexMixin, self)._extend(items)
+        self._positions = None
+
+    def _pop(self, i=-1):
+        item = super(BTHeaderIndexMixin, self)._pop(i)
+        self._positions = None
+        return item
+
+    def _remove(self, item):
+        super(BTHeaderIndexMixin, self)._remove(item)
+        self._positions = None
+
+    def _reverse(self):
+        super(BTHeaderIndexMixin, self)._reverse()
+        self._positions = None
+
+    def _sort(self, key, reverse=False):
+        super(BTHeaderIndexMixin, self)._sort(key, reverse)
+        self._positions = None
+
+    def _permute(self, order):
+        super(BTHeaderIndexMixin, self)._permute(order)
+        self._positions = None
+
+    def _clear(self):
+        super(BTHeaderIndexMixin, self)._clear()
+        self._positions = None
+
+
+class BTRowHeader(BTHeaderIndexMixin, BTBaseColumn):
     def __init__(self, table, value):
         for i in value:
             self._validate_item(i)
         super(BTRowHeader, self).__init__(table, value)
+        list_type = self._table._data._list_type
+        if list_type is not list:
+            self._value = list_type(self._value)
 
     def __setitem__(self, key, value):
         self._validate_item(value)
@@ -24,7 +115,7 @@ class BTRowHeader(BTBaseColumn):
             raise TypeError(f"header must be of type 'str', got {type(value).__name__}")
 
 
-class BTColumnHeader(BTBaseRow):
+class BTColumnHeader(BTHeaderIndexMixin, BTBaseRow):
     def __init__(self, table, value):
         for i in value:
             self._validate_item(i)
@@ -80,82 +171,43 @@ class BTColumnHeader(BTBaseRow):
 
 
 class BTRowData(BTBaseRow):
+    __slots__ = ()
+
+    @property
+    def value(self):
+        # The row can be modified through the returned list, hence the hash
+        # index and the sorted columns of the table can't be trusted anymore
+        data = self._table._data
+        data._row_index = None
+        data._sorted_columns = None
+        return self._value
+
+    def __setitem__(self, key, value):
+        super(BTRowData, self).__setitem__(key, value)
+        # The hash index and the sorted columns of the table are stale now
+        data = self._table._data
+        data._row_index = None
+        data._sorted_columns = None
+
     def _get_padding(self):
         return (
             self._table.columns.padding_left,
             self._table.columns.padding_right,
         )
 
-    def _clamp_row(self, row):
-        """Process a row so that it is clamped by column_width.
-
-        Parameters
-        ----------
-        row : array_like
-             A single row.
-
-        Returns
-        -------
-        list of list:
-            List representation of the `row` after it has been processed
-            according to width exceed policy.
-        """
-        table = self._table
-        lpw, rpw = self._get_padding()
-        wep = table.columns.width_exceed_policy
-
-        result = []
-
-        if (
-            wep is enums.WidthExceedPolicy.WEP_STRIP
-            or wep is enums.WidthExceedPolicy.WEP_ELLIPSIS
-        ):
-
-            # Let's strip the row
-            delimiter = "" if wep is enums.WidthExceedPolicy.WEP_STRIP else "..."
-            row_item_list = []
-            for index, row_item in enumerate(row):
-                left_pad = table.columns._pad_character * lpw[index]
-                right_pad = table.columns._pad_character * rpw[index]
-                clmp_str = (
-                    left_pad
-                    + self._clamp_string(row_item, index, delimiter)
-                    + right_pad
-                )
-                row_item_list.append(clmp_str)
-            result.append(row_item_list)
-        elif wep is enums.WidthExceedPolicy.WEP_WRAP:
-
-            # Let's wrap the row
-            string_partition = []
-
-            for index, row_item in enumerate(row):
-                width = table.columns.width[index] - lpw[index] - rpw[index]
-                string_partition.append(textwrap(row_item, width))
+    def _clamp_string(self, row_item, width, delimiter=""):
+        """Clamp `row_item` to fit in `width` characters.
 
-            for row_items in zip_longest(*string_partition, fillvalue=""):
-                row_item_list = []
-                for index, row_item in enumerate(row_items):
-                    left_pad = table.columns._pad_character * lpw[index]
-                    right_pad = table.columns._pad_character * rpw[index]
-                    row_item_list.append(left_pad + row_item + right_pad)
-                result.append(row_item_list)
-
-        return result or [[""] * len(table.columns)]
-
-    def _clamp_string(self, row_item, index, delimiter=""):
-        """Clamp `row_item` to fit in column referred by index.
-
-        This method considers padding and appends the delimiter if `row_item`
-        needs to be truncated.
+        This method appends the delimiter if `row_item` needs to be truncated.
 
         Parameters
         ----------
         row_item: str
             String which should be clamped.
 
-        index: int
-            Index of the column `row_item` belongs to.
+        width: int
+            Width available for `row_item`, excluding the padding of its
+            column.
 
         delimiter: str
             String which is to be appended to the clamped string.
@@ -165,9 +217,6 @@ class BTRowData(BTBaseRow):
         str
             The modified string which fits in it's column.
         """
-        lpw, rpw = self._get_padding()
-        width = self._table.columns.width[index] - lpw[index] - rpw[index]
-
         if termwidth(row_item) <= width:
             return row_item
         else:
@@ -185,71 +234,124 @@ class BTRowData(BTBaseRow):
         mask=None,
         draw_left_border=True,
         draw_right_border=True,
+        cache=None,
+        memoize=None,
     ):
-        """Return a string representation of a row."""
+        """Return a string representation of a row.
 
-        rows = []
+        `cache` can hold a dict for each column, in which the rendered lines
+        of a cell are memoized by its value. Empty cells are always memoized,
+        while other values are only memoized for columns flagged in
+        `memoize`. This is meant for columns with few distinct values, such
+        as encoded columns.
+        """
 
         table = self._table
-        width = table.columns.width
+        # Metadata is copied into lists as it is read for every cell
+        width = list(table.columns.width)
         sign = table.sign
+        wep = table.columns.width_exceed_policy
 
         if align is None:
             align = table.columns.alignment
+        align = list(align)
 
         if mask is None:
             mask = [True] * len(table.columns)
 
-        lpw, rpw = self._get_padding()
+        lpw, rpw = map(list, self._get_padding())
+        pad_char = table.columns._pad_character
+        if wep is enums.WidthExceedPolicy.WEP_STRIP:
+            delimiter = ""
+        elif wep is enums.WidthExceedPolicy.WEP_ELLIPSIS:
+            delimiter = "..."
+        else:
+            delimiter = None
+
+        def align_line(line, index):
+            # str.format method doesn't work for multibyte strings
+            # hence, we need to manually align the texts instead
+            # of using the align property of the str.format method
+            pad_len = width[index] - termwidth(line)
+            if align[index].value == "<":
+                return to_unicode(line) + " " * pad_len
+            elif align[index].value == ">":
+                return " " * pad_len + to_unicode(line)
+            else:
+                left_pad = " " * (pad_len // 2)
+                right_pad = " " * (pad_len - pad_len // 2)
+                return left_pad + to_unicode(line) + right_pad
+
+        def render_line(line, index):
+            """Return the aligned lines of the cell for a line of its value."""
+            line = pre_process(line, table.detect_numerics, table.precision, sign.value)
+            left_pad = pad_char * lpw[index]
+            right_pad = pad_char * rpw[index]
+            available = width[index] - lpw[index] - rpw[index]
+            if delimiter is None:
+                # Let's wrap the line
+                items = textwrap(line, available)
+            else:
+                # Let's strip the line
+                items = [self._clamp_string(line, available, delimiter)]
+            return [align_line(left_pad + item + right_pad, index) for item in items]
 
-        string = []
+        cells = []
         for i, item in enumerate(self._value):
+            memo = None
+            if cache is not None and (item is None or memoize[i]):
+                memo = cache[i]
+                key = (type(item), item)
+                if key in memo:
+                    cells.append(memo[key])
+                    continue
             if isinstance(item, type(table)):
                 # temporarily change the max width of the table
                 curr_maxwidth = item.maxwidth
                 item.maxwidth = width[i] - lpw[i] - rpw[i]
-                rows.append(
-                    pre_process(
-                        item,
-                        table.detect_numerics,
-                        table.precision,
-                        sign.value,
-                    ).split("\n")
-                )
+                lines = pre_process(
+                    item,
+                    table.detect_numerics,
+                    table.precision,
+                    sign.value,
+                ).split("\n")
                 item.maxwidth = curr_maxwidth
             else:
-                rows.append(
-                    pre_process(
-                        item,
-                        table.detect_numerics,
-                        table.precision,
-                        sign.value,
-                    ).split("\n")
-                )
-        for row in map(list, zip_longest(*rows, fillvalue="")):
-            for i in range(len(row)):
-                row[i] = pre_process(
-                    row[i],
+                lines = pre_process(
+                    item,
                     table.detect_numerics,
                     table.precision,
                     sign.value,
-                )
-            for row_ in self._clamp_row(row):
-                for i in range(len(table.columns)):
-                    # str.format method doesn't work for multibyte strings
-                    # hence, we need to manually align the texts instead
-                    # of using the align property of the str.format method
-                    pad_len = width[i] - termwidth(row_[i])
-                    if align[i].value == "<":
-                        right_pad = " " * pad_len
-                        row_[i] = to_unicode(row_[i]) + right_pad
-                    elif align[i].value == ">":
-                        left_pad = " " * pad_len
-                        row_[i] = left_pad + to_unicode(row_[i])
-                    else:
-                        left_pad = " " * (pad_len // 2)
-                        right_pad = " " * (pad_len - pad_len // 2)
-                        row_[i] = left_pad + to_unicode(row_[i]) + right_pad
+                ).split("\n")
+            cell = [render_line(line, i) for line in lines]
+            if memo is not None:
+                memo[key] = cell
+            cells.append(cell)
+
+        string = []
+        blank = [None] * len(cells)
+        for line_row in zip_longest(*cells):
+            # Cells with fewer lines are extended with empty lines
+            pieces = []
+            for i, cell_lines in enumerate(line_row):
+                if cell_lines is None:
+                    if blank[i] is None:
+                        blank[i] = render_line("", i)
+                    cell_lines = blank[i]
+                pieces.append(cell_lines)
+            if not any(pieces):
+                pieces = [[" " * width[i]] for i in range(len(pieces))]
+            for row_ in zip_longest(*pieces):
+                if None in row_:
+                    # Wrapped cells with fewer lines are extended with padding
+                    row_ = [
+                        (
+                            align_line(pad_char * (lpw[i] + rpw[i]), i)
+                            if item is None
+                            else item
+                        )
+                        for i, item in enumerate(row_)
+                    ]
                 content = []
                 for j, item in enumerate(row_):
                     if j > 0:
@@ -276,7 +378,7 @@ class BTRowData(BTBaseRow):
 
     def aslist(self):
         """Return list of row values."""
-        return self.value
+        return list(self._value)
 
     def asdict(self):
         """
@@ -284,7 +386,7 @@ class BTRowData(BTBaseRow):
         raise a Warning if coulmn header invalid(not provided) or empty.
         """
         header_rowval_map = {}
-        for header, row_val in zip(self._table.columns.header, self.value):
+        for header, row_val in zip(self._table.columns.header, self._value):
             if header is None or header == "":
                 raise Warning("Column header is not provided or invalid")
             header_rowval_map[header] = row_val
@@ -292,9 +394,23 @@ class BTRowData(BTBaseRow):
 
 
 class BTColumnData(BTBaseColumn):
+    """Values of a column of a table.
+
+    A column obtained from :attr:`.BeautifulTable.columns` is a view, which
+    reads its values from the table without copying them. It refers to a
+    position in the table, so it should not be held on to while columns
+    are being inserted or removed. Use :meth:`copy` for a snapshot.
+    """
+
+    __slots__ = ()
+
+    def copy(self):
+        """Return a copy of the column, unaffected by changes to the table."""
+        return BTColumnData(self._table, self._value)
+
     def aslist(self):
         """Return list of column values."""
-        return self.value
+        return list(self._value)
 
     def asdict(self):
         """
@@ -303,6 +419,62 @@ class BTColumnData(BTBaseColumn):
         raise NotImplementedError("Currently supported for rows only")
 
 
+class BTColumnValue(object):
+    """Values of a single column, read through from the rows of a table.
+
+    The values can only be changed through the table.
+    """
+
+    __slots__ = ("_table_ref", "_index")
+
+    def __init__(self, table, index):
+        self._table_ref = weakref.ref(table)
+        self._index = index
+
+    @property
+    def _data(self):
+        return self._table_ref()._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return self._data._itercolumn(self._index)
+
+    def __getitem__(self, key):
+        data = self._data
+        indices = range(len(data))
+        if isinstance(key, slice):
+            return [data._peek(i)[self._index] for i in indices[key]]
+        return data._peek(indices[key])[self._index]
+
+    def __contains__(self, item):
+        return any(value == item for value in self)
+
+    def __eq__(self, other):
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def _unsupported(self, *args, **kwargs):
+        raise TypeError(
+            "a column can only be changed through 'BeautifulTable.columns', "
+            "use 'copy' to get a modifiable column"
+        )
+
+    __setitem__ = __delitem__ = insert = pop = append = extend = _unsupported
+    remove = clear = reverse = sort = _unsupported
+
+    def count(self, item):
+        return sum(1 for value in self if value == item)
+
+    def index(self, item, *args):
+        return list(self).index(item, *args)
+
+
 class BTRowCollection(object):
     def __init__(self, table):
         self._table = table
@@ -360,7 +532,8 @@ class BTRowCollection(object):
         key : int, slice, str
             If key is an `int`, returns a row at index `key`.
             If key is an `str`, returns the first row with heading `key`.
-            If key is a slice object, returns a new sliced table.
+            If key is a slice object, returns a new sliced table. Only the
+            metadata of the table and the rows in the slice are copied.
 
         Raises
         ------
@@ -372,12 +545,7 @@ class BTRowCollection(object):
             If `str` key is not found in header.
         """
         if isinstance(key, slice):
-            new_table = copy.deepcopy(self._table)
-            new_table.rows.clear()
-            new_table.rows.header = self._table.rows.header[key]
-            for i, r in enumerate(self._table._data[key]):
-                new_table.rows[i] = r.value
-            return new_table
+            return self._take(range(len(self))[key])
         if isinstance(key, (int, basestring)):
             return self._table._data[key]
         raise TypeError(
@@ -385,19 +553,21 @@ class BTRowCollection(object):
         )
 
     def __delitem__(self, key):
-        """Delete a row, or multiple rows by slicing.
+        """Delete a row, or multiple rows by slicing or with a list.
 
         Parameters
         ----------
-        key : int, slice, str
+        key : int, slice, str, list
             If key is an `int`, deletes a row at index `key`.
             If key is an `str`, deletes the first row with heading `key`.
             If key is a slice object, deletes multiple rows.
+            If key is a list of `int` or `str`, deletes all those rows in a
+            single pass over the table.
 
         Raises
         ------
         TypeError
-            If key is not of type int, slice or str.
+            If key is not of type int, slice, str or list.
         IndexError
             If `int` key is out of range.
         KeyError
@@ -406,9 +576,19 @@ class BTRowCollection(object):
         if isinstance(key, (int, basestring, slice)):
             del self._table._data[key]
             del self.header[key]
+        elif isinstance(key, list):
+            indices = range(len(self))
+            removed = set()
+            for item in key:
+                if not isinstance(item, (int, basestring)):
+                    raise TypeError(
+                        f"row indices must be int or str, not {type(item).__name__}"
+                    )
+                removed.add(indices[self._canonical_key(item)])
+            self._compact([i for i in indices if i not in removed])
         else:
             raise TypeError(
-                f"row indices must be int, str or a slice object, not {type(key).__name__}"
+                f"row indices must be int, str, a slice object or a list, not {type(key).__name__}"
             )
 
     def __setitem__(self, key, value):
@@ -454,12 +634,34 @@ class BTRowCollection(object):
     def __repr__(self):
         return repr(self._table._data)
 
+    def index(self, row, *args):
+        """Return the position of the first row equal to `row`.
+
+        Lookups are O(1) on average, through a hash index of the rows which
+        is built on first use and kept up to date as rows are appended. It
+        is rebuilt after any other change to the table.
+
+        Parameters
+        ----------
+        row : iterable
+            Values of the row.
+        start, stop : int, optional
+            Only rows at positions from `start` to `stop` are searched.
+
+        Raises
+        ------
+        KeyError:
+            If no such row is present.
+        """
+        return self._table._data.index(row, *args)
+
     def __str__(self):
         return str(self._table._data)
 
     def reverse(self):
         """Reverse the table row-wise *IN PLACE*."""
         self._table._data._reverse()
+        self.header._reverse()
 
     def pop(self, index=-1):
         """Remove and return row at index (default last).
@@ -504,8 +706,14 @@ class BTRowCollection(object):
         if self._table._ncol == 0:
             row = list(row)
             self._table.columns._reset_state(len(row))
-        self.header._insert(index, header)
-        self._table._data._insert(index, BTRowData(self._table, row))
+        row = BTRowData(self._table, row)
+        if index >= len(self):
+            # Appending keeps the hash index of the rows up to date
+            self.header._append(header)
+            self._table._data._append(row)
+        else:
+            self.header._insert(index, header)
+            self._table._data._insert(index, row)
 
     def append(self, row, header=None):
         """Append a row to end of the table.
@@ -521,6 +729,101 @@ class BTRowCollection(object):
         """
         self.insert(len(self), row, header)
 
+    def extend(self, rows, header=None):
+        """Append all the rows from an iterable to the end of the table.
+
+        This is faster than calling :meth:`append` for every row, as rows
+        are validated together and added in a single step. If any row is
+        invalid, the table is left unchanged.
+
+        Parameters
+        ----------
+        rows : iterable
+            Any iterable of rows, each of appropriate length.
+
+        header : iterable, optional
+            Headings of the rows.
+
+        Raises
+        ------
+        ValueError:
+            If size of any row is inconsistent with the current number
+            of columns, or if length of `header` is different from number
+            of rows.
+        """
+        table = self._table
+        rows = [list(row) for row in rows]
+        if header is None:
+            header = [None] * len(rows)
+        else:
+            header = list(header)
+            if len(header) != len(rows):
+                raise ValueError(
+                    f"'Expected iterable of length {len(rows)}, got {len(header)}"
+                )
+            for item in header:
+                self.header._validate_item(item)
+        if not rows:
+            return
+
+        ncol = table._ncol or len(rows[0])
+        for row in rows:
+            if len(row) != ncol:
+                raise ValueError(f"'Expected iterable of length {ncol}, got {len(row)}")
+        if table._ncol == 0:
+            table.columns._reset_state(ncol)
+        table._data._extend(rows)
+        self.header._extend(header)
+
+    def adopt(self, rows, header=None):
+        """Replace the rows of the table with `rows` without copying them.
+
+        `rows` can be any sequence of rows supporting ``len`` and indexing,
+        such as a list of tuples returned by a database driver. A row is
+        converted to a :class:`~.BTRowData`, and its length validated, only
+        when it is accessed. Until rows are inserted, removed or reordered,
+        the table reads directly from `rows`. Existing rows are discarded,
+        while column metadata is kept.
+
+        Parameters
+        ----------
+        rows : sequence
+            Sequence of rows, each of appropriate length.
+
+        header : iterable, optional
+            Headings of the rows.
+
+        Raises
+        ------
+        TypeError:
+            If a heading is not of type `str` or None.
+
+        ValueError:
+            If length of `header` is different from length of `rows`, or
+            when a row of inconsistent length is accessed. The columnar and
+            sparse storages copy the rows right away, hence they validate
+            every row here.
+        """
+        table = self._table
+        header = [None] * len(rows) if header is None else list(header)
+        if len(header) != len(rows):
+            raise ValueError(
+                f"'Expected iterable of length {len(rows)}, got {len(header)}"
+            )
+        for item in header:
+            self.header._validate_item(item)
+        ncol = table._ncol
+        if ncol == 0 and len(rows) > 0:
+            table.columns._reset_state(len(rows[0]))
+        try:
+            table._data = type(table._data)._adopt(table, rows)
+        except Exception:
+            # Leave the table as it was
+            if ncol == 0:
+                table.columns._reset_state(0)
+            raise
+        self.header = header
+
     def update(self, key, value):
         """Update row(s) identified with `key` in the table.
 
@@ -555,41 +858,511 @@ class BTRowCollection(object):
     def sort(self, key, reverse=False):
         """Stable sort of the table *IN-PLACE* with respect to a column.
 
+        The key of every row is computed once, and the rows and their
+        headers are reordered together. Values which are None are placed
+        after all other values, irrespective of the direction.
+
         Parameters
         ----------
-        key: int, str
-            index or header of the column. Normal list rules apply.
-        reverse : bool
+        key: int, str, callable or list
+            index or header of the column, or a callable which is passed
+            each row. Normal list rules apply. If `key` is a list of these,
+            the table is sorted by each of them in order, the first one
+            taking precedence.
+        reverse : bool or list of bool
             If `True` then table is sorted as if each comparison was reversed.
+            If `key` is a list, this can be a list with the direction of
+            each key.
+
+        Raises
+        ------
+        TypeError:
+            If a key is not an `int`, `str` or a callable.
+
+        ValueError:
+            If `reverse` is a list whose length is different from `key`.
+        """
+        keys = list(key) if isinstance(key, (list, tuple)) else [key]
+        if isinstance(reverse, (list, tuple)):
+            reverse = list(reverse)
+            if len(reverse) != len(keys):
+                raise ValueError(
+                    f"'Expected iterable of length {len(keys)}, got {len(reverse)}"
+                )
+        else:
+            reverse = [reverse] * len(keys)
+
+        data = self._table._data
+        order = list(range(len(data)))
+        # Stable sorts from the last key to the first one sort by all of them
+        for key, descending in reversed(list(zip(keys, reverse))):
+            values = self._get_sort_values(key, descending)
+            order.sort(key=values.__getitem__, reverse=descending)
+        data._permute(order)
+        self.header = [self.header[i] for i in order]
+        if isinstance(keys[0], (int, basestring)) and not reverse[0]:
+            # Let searchsorted use the column without checking its order
+            data._sorted_column(self._get_column_index(keys[0]), check=False)
+
+    def _get_column_index(self, key):
+        """Return the non-negative index of the column `key`."""
+        return range(self._table._ncol)[self._table.columns._canonical_key(key)]
+
+    def searchsorted(self, key, value, side="left"):
+        """Return the position where a row with `value` in column `key`
+        would be inserted to keep the table sorted.
+
+        The table should be sorted in ascending order of the column, with
+        values which are None at the end, like :meth:`sort` does. Lookups
+        are binary searches in O(log n). The values of the column are read
+        and checked on the first lookup, and are kept until the table is
+        modified other than by appending rows in order. Sorting the table
+        by the column provides them directly.
+
+        Parameters
+        ----------
+        key : int, str
+            index or header of the column.
+        value : object
+            Value to search for.
+        side : {'left', 'right'}
+            If 'left', returns the position of the first row whose value is
+            not less than `value`, else the position after the last row whose
+            value is not greater than `value`.
+
+        Returns
+        -------
+        int:
+            Position in the table.
+
+        Raises
+        ------
+        ValueError:
+            If the table is not sorted by the column, or if `side` is
+            neither 'left' nor 'right'.
+        """
+        if side not in ("left", "right"):
+            raise ValueError("'side' must be either 'left' or 'right'")
+        bisect_ = bisect.bisect_left if side == "left" else bisect.bisect_right
+        return bisect_(self._get_sorted_column(key), value)
+
+    def range(self, key, start=None, stop=None):
+        """Return a new table with the rows whose value of column `key` is
+        from `start` up to, but not including, `stop`.
+
+        The table should be sorted by the column, and the rows are located
+        by binary search, as in :meth:`searchsorted`. Only the metadata of
+        the table and the selected rows are copied.
+
+        Parameters
+        ----------
+        key : int, str
+            index or header of the column.
+        start, stop : object, optional
+            Bounds of the values. If omitted, there is no such bound. Rows
+            where the value is None are never selected.
+
+        Returns
+        -------
+        BeautifulTable:
+            Table with the selected rows, in order.
+
+        Raises
+        ------
+        ValueError:
+            If the table is not sorted by the column.
+        """
+        values = self._get_sorted_column(key)
+        lo = 0 if start is None else bisect.bisect_left(values, start)
+        hi = len(values) if stop is None else bisect.bisect_left(values, stop)
+        return self._take(range(lo, max(lo, hi)))
+
+    def insort(self, row, key, header=None):
+        """Insert a row where it keeps the table sorted by column `key`.
+
+        The table should be sorted in ascending order of the column, like
+        :meth:`sort` does. The position is found by binary search over the
+        cached values of the column, as in :meth:`searchsorted`, and the
+        cache is updated with the new row, hence each insertion costs
+        O(log n) plus shifting the rows after it. The row is placed after
+        the rows with an equal value, or last if its value is None.
+
+        Parameters
+        ----------
+        row : iterable
+            Any iterable of appropriate length.
+        key : int, str
+            index or header of the column.
+        header : str, optional
+            Heading of the row
+
+        Returns
+        -------
+        int:
+            Position of the new row.
+
+        Raises
+        ------
+        ValueError:
+            If the table has no columns, if the table is not sorted by the
+            column, or if size of `row` is inconsistent with the current
+            number of columns.
+        """
+        if self._table._ncol == 0:
+            raise ValueError("cannot insort into a table without columns")
+        values = self._get_sorted_column(key)
+        index = self._get_column_index(key)
+        row = list(row)
+        value = row[index] if index < len(row) else None
+        position = len(self) if value is None else bisect.bisect_right(values, value)
+        if position == len(self):
+            # Appending keeps the cached values up to date
+            self.append(row, header)
+        else:
+            self.insert(position, row, header)
+            values.insert(position, value)
+            self._table._data._sorted_columns = {index: values}
+        return position
+
+    def _get_sorted_column(self, key):
+        if not isinstance(key, (int, basestring)):
+            raise TypeError("'key' must either be 'int' or 'str'")
+        return self._table._data._sorted_column(self._get_column_index(key))
+
+    def _get_sort_values(self, key, descending=False):
+        """Return the value of `key` for every row, to sort them.
+
+        Values are decorated if needed, so that None is placed after all
+        other values when sorting in the given direction.
         """
         if isinstance(key, (int, basestring)):
-            key = operator.itemgetter(key)
+            key = self._table.columns._canonical_key(key)
+            values = list(self._table._data._column(key))
         elif callable(key):
-            pass
+            values = [key(row) for row in self._table._data]
         else:
             raise TypeError("'key' must either be 'int' or 'str' or a 'callable'")
+        if any(value is None for value in values):
+            values = [
+                ((value is not None) if descending else (value is None), value)
+                for value in values
+            ]
+        return values
+
+    def _take(self, indices):
+        """Return a new table with the rows at `indices`, in that order.
+
+        Only the metadata of the table is copied, along with the selected
+        rows and their headers.
+        """
+        table = self._table
+        new_table = table._copy_without_rows()
+        new_table.rows.extend(
+            [table._data._peek(i) for i in indices],
+            header=[self.header[i] for i in indices],
+        )
+        return new_table
+
+    def nlargest(self, k, key):
+        """Return a new table with the `k` rows with the largest values of `key`.
+
+        Rows are selected with a heap in O(n log k), which is faster than
+        sorting the table and slicing it. Only the selected rows are
+        copied. Rows are ordered from the largest, and ties keep the order
+        of the table. Values which are None are ranked below all others.
+
+        Parameters
+        ----------
+        k : int
+            Number of rows to select.
+        key: int, str or callable
+            index or header of the column, or a callable which is passed
+            each row.
+
+        Returns
+        -------
+        BeautifulTable:
+            Table with at most `k` rows.
+        """
+        values = self._get_sort_values(key, descending=True)
+        return self._take(heapq.nlargest(k, range(len(values)), key=values.__getitem__))
 
-        indices = sorted(
-            range(len(self)),
-            key=lambda x: key(self._table._data[x]),
-            reverse=reverse,
+    def nsmallest(self, k, key):
+        """Return a new table with the `k` rows with the smallest values of `key`.
+
+        Rows are selected with a heap in O(n log k), which is faster than
+        sorting the table and slicing it. Only the selected rows are
+        copied. Rows are ordered from the smallest, and ties keep the order
+        of the table. Values which are None are ranked above all others.
+
+        Parameters
+        ----------
+        k : int
+            Number of rows to select.
+        key: int, str or callable
+            index or header of the column, or a callable which is passed
+            each row.
+
+        Returns
+        -------
+        BeautifulTable:
+            Table with at most `k` rows.
+        """
+        values = self._get_sort_values(key)
+        return self._take(
+            heapq.nsmallest(k, range(len(values)), key=values.__getitem__)
         )
-        self._table._data._sort(key=key, reverse=reverse)
-        self.header = [self.header[i] for i in indices]
+
+    def groupby(self, key):
+        """Group the rows of the table by the values of `key`.
+
+        Parameters
+        ----------
+        key: int, str, callable or list
+            index or header of the column, or a callable which is passed
+            each row. If `key` is a list of these, rows are grouped by all
+            of them.
+
+        Returns
+        -------
+        BTRowGroupBy:
+            Groups on which :meth:`~.BTRowGroupBy.agg` computes aggregates.
+        """
+        return BTRowGroupBy(self._table, key)
 
     def filter(self, key):
         """Return a copy of the table with only those rows which satisfy a
         certain condition.
 
+        `key` is called once for each row, and only the metadata of the
+        table and the matching rows, along with their headers, are copied.
+
         Returns
         -------
         BeautifulTable:
             Filtered copy of the BeautifulTable instance.
         """
-        new_table = self._table.rows[:]
-        new_table.rows.clear()
-        for row in filter(key, self):
-            new_table.rows.append(row)
+        rows = self._table._data._iterview()
+        return self._take([i for i, row in enumerate(rows) if key(row)])
+
+    def drop_duplicates(self, subset=None, keep="first"):
+        """Remove duplicate rows from the table *IN-PLACE*.
+
+        The values of every row are hashed once, and the remaining rows and
+        their headers are compacted in a single pass.
+
+        Parameters
+        ----------
+        subset: int, str or list, optional
+            index or header of the column, or a list of these, whose values
+            identify a row. By default all the columns are used.
+        keep : {'first', 'last', False}
+            Which row of each set of duplicates is kept. If `False`, all
+            duplicated rows are removed.
+
+        Returns
+        -------
+        int:
+            Number of rows removed.
+
+        Raises
+        ------
+        ValueError:
+            If `keep` is not one of 'first', 'last' or `False`.
+
+        TypeError:
+            If a value to be compared can't be hashed.
+        """
+        if keep not in ("first", "last", False):
+            raise ValueError("'keep' must be one of 'first', 'last' or False")
+        data = self._table._data
+        if subset is None:
+            getter = tuple
+        else:
+            keys = list(subset) if isinstance(subset, (list, tuple)) else [subset]
+            indices = [self._table.columns._canonical_key(key) for key in keys]
+            getter = operator.itemgetter(*indices)
+        values = [getter(row) for row in data._itervalues()]
+
+        if keep is False:
+            counts = collections.Counter(values)
+            order = [i for i, value in enumerate(values) if counts[value] == 1]
+        else:
+            positions = range(len(values))
+            if keep == "last":
+                positions = reversed(positions)
+            seen = set()
+            order = []
+            for i in positions:
+                value = values[i]
+                if value not in seen:
+                    seen.add(value)
+                    order.append(i)
+            if keep == "last":
+                order.reverse()
+
+        removed = len(values) - len(order)
+        if removed:
+            self._compact(order)
+        return removed
+
+    def remove_where(self, key):
+        """Remove the rows which satisfy a certain condition *IN-PLACE*.
+
+        `key` is called once for each row, and the remaining rows and their
+        headers are compacted in a single pass, instead of shifting the
+        table once for every removed row.
+
+        Returns
+        -------
+        int:
+            Number of rows removed.
+        """
+        rows = self._table._data._iterview()
+        order = [i for i, row in enumerate(rows) if not key(row)]
+        removed = len(self) - len(order)
+        if removed:
+            self._compact(order)
+        return removed
+
+    def _compact(self, order):
+        """Keep only the rows at positions in `order`, in that order."""
+        self._table._data._permute(order)
+        self.header = [self.header[i] for i in order]
+
+
+def _agg_min(acc, value):
+    return value if acc is None or value < acc else acc
+
+
+def _agg_max(acc, value):
+    return value if acc is None or value > acc else acc
+
+
+def _agg_append(acc, value):
+    acc.append(value)
+    return acc
+
+
+def _agg_mean(acc):
+    return acc[0] / acc[1] if acc[1] else None
+
+
+# Aggregations supported by BTRowGroupBy.agg, as a function returning the
+# initial state, a function updating the state with a value, and a function
+# returning the result from the final state.
+_AGGREGATIONS = {
+    "count": (int, lambda acc, value: acc + 1, None),
+    "sum": (int, operator.add, None),
+    "mean": (
+        lambda: (0, 0),
+        lambda acc, value: (acc[0] + value, acc[1] + 1),
+        _agg_mean,
+    ),
+    "min": (lambda: None, _agg_min, None),
+    "max": (lambda: None, _agg_max, None),
+    "first": (lambda: None, lambda acc, value: value if acc is None else acc, None),
+    "last": (lambda: None, lambda acc, value: value, None),
+}
+
+
+class BTRowGroupBy(object):
+    """Rows of a table grouped by the values of one or more keys.
+
+    It is created by :meth:`BTRowCollection.groupby`.
+    """
+
+    def __init__(self, table, key):
+        self._table = table
+        self._keys = list(key) if isinstance(key, (list, tuple)) else [key]
+        for key in self._keys:
+            if not (isinstance(key, (int, basestring)) or callable(key)):
+                raise TypeError("'key' must either be 'int' or 'str' or a 'callable'")
+
+    def _get_accessor(self, key):
+        """Return the heading and a function which reads `key` from a row."""
+        table = self._table
+        if callable(key):
+            return None, lambda row: key(BTRowData._wrap(table, row))
+        index = table.columns._canonical_key(key)
+        return table.columns.header[index], operator.itemgetter(index)
+
+    def agg(self, aggregations, rows=None):
+        """Aggregate the values of some columns for each group.
+
+        Rows are scanned once, and only one accumulator for each aggregation
+        and group is kept in memory. Values which are None are ignored.
+
+        Parameters
+        ----------
+        aggregations : dict
+            Maps the heading of each new column to a tuple of a column, as
+            an index or a heading, and an aggregation. The aggregation can be
+            one of 'count', 'sum', 'mean', 'min', 'max', 'first' or 'last',
+            or a callable which is passed the list of values of a group.
+        rows : iterable, optional
+            If given, these rows are aggregated instead of the rows of the
+            table, without being stored first. They should have the columns
+            of the table.
+
+        Returns
+        -------
+        BeautifulTable:
+            Table with the keys followed by the aggregated columns, with a
+            row for each group in order of first appearance.
+
+        Raises
+        ------
+        ValueError:
+            If an aggregation is unknown.
+        """
+        table = self._table
+        headers, key_getters = zip(*(self._get_accessor(key) for key in self._keys))
+        if len(key_getters) == 1:
+            key_getter = key_getters[0]
+        else:
+
+            def key_getter(row):
+                return tuple(getter(row) for getter in key_getters)
+
+        getters, accumulators = [], []
+        for column, func in aggregations.values():
+            getters.append(self._get_accessor(column)[1])
+            if callable(func):
+                accumulators.append((list, _agg_append, func))
+            elif func in _AGGREGATIONS:
+                accumulators.append(_AGGREGATIONS[func])
+            else:
+                allowed = ", ".join(repr(name) for name in _AGGREGATIONS)
+                raise ValueError(f"aggregation must be one of {allowed} or a callable")
+        steps = list(zip(getters, (step for init, step, result in accumulators)))
+
+        if rows is None:
+            rows = table._data._itervalues()
+        groups = {}
+        for row in rows:
+            key = key_getter(row)
+            states = groups.get(key)
+            if states is None:
+                states = groups[key] = [init() for init, step, result in accumulators]
+            for i, (getter, step) in enumerate(steps):
+                value = getter(row)
+                if value is not None:
+                    states[i] = step(states[i], value)
+
+        new_table = table._copy_without_rows()
+        new_table.columns.clear()
+        new_table.columns.header = list(headers) + list(aggregations)
+        if len(key_getters) == 1:
+            groups = {(key,): states for key, states in groups.items()}
+        new_table.rows.extend(
+            list(key)
+            + [
+                state if result is None else result(state)
+                for state, (init, step, result) in zip(states, accumulators)
+            ]
+            for key, states in groups.items()
+        )
         return new_table
 
 
@@ -844,6 +1617,10 @@ class BTColumnCollection(object):
     def __getitem__(self, key):
         """Get a column, or a new table by slicing.
 
+        A column is returned as a view which reads through to the table, so
+        getting it doesn't copy its values. Use :meth:`.BTColumnData.copy`
+        to get a snapshot.
+
         Parameters
         ----------
 
@@ -875,7 +1652,7 @@ class BTColumnCollection(object):
             new_table.columns.width = self.width[key]
             new_table.columns._auto_width = self._auto_width
             for i, r in enumerate(self._table._data):
-                new_table.rows[i] = r.value[key]
+                new_table.rows[i] = r._value[key]
             return new_table
         elif isinstance(key, basestring):
             key = self.header.index(key)
@@ -884,7 +1661,8 @@ class BTColumnCollection(object):
                 f"column indices must be integers, strings or slices, not {type(key).__name__}"
             )
 
-        return BTColumnData(self._table, [row[key] for row in self._table._data])
+        index = range(self._table._ncol)[key]
+        return BTColumnData._wrap(self._table, BTColumnValue(self._table, index))
 
     def __delitem__(self, key):
         """Delete a column, or multiple columns by slicing.
@@ -914,8 +1692,7 @@ class BTColumnCollection(object):
             del self.width[key]
             del self.padding_left[key]
             del self.padding_right[key]
-            for row in self._table.rows:
-                del row[key]
+            self._table._data._delete_column(key)
             del self.header[key]
             if self.header.alignment is not None:
                 del self.header.alignment[key]
@@ -950,8 +1727,7 @@ class BTColumnCollection(object):
         """
         if not isinstance(key, (int, basestring, slice)):
             raise TypeError("column indices must be of type int, str or a slice object")
-        for row, new_item in zip(self._table.rows, value):
-            row[key] = new_item
+        self._table._data._set_column(self._canonical_key(key), value)
 
     def __contains__(self, key):
         if isinstance(key, basestring):
@@ -998,11 +1774,8 @@ class BTColumnCollection(object):
         if self._table._ncol == 0:
             raise IndexError("pop from empty table")
         else:
-            res = []
             index = self._canonical_key(index)
-            for row in self._table.rows:
-                res.append(row._pop(index))
-            res = BTColumnData(self._table, res)
+            res = BTColumnData(self._table, self._table._data._pop_column(index))
             self.alignment._pop(index)
             self.width._pop(index)
             self.padding_left._pop(index)
@@ -1039,6 +1812,27 @@ class BTColumnCollection(object):
         """
         self[key] = value
 
+    def _get_column_options(self, padding_left, padding_right, alignment):
+        """Validate options for new columns, substituting defaults for None."""
+        padding_left = self.default_padding if padding_left is None else padding_left
+        padding_right = self.default_padding if padding_right is None else padding_right
+        alignment = self.default_alignment if alignment is None else alignment
+        if not isinstance(padding_left, int):
+            raise TypeError(
+                f"'padding_left' should be of type 'int' not '{type(padding_left).__name__}'"
+            )
+
+        if not isinstance(padding_right, int):
+            raise TypeError(
+                f"'padding_right' should be of type 'int' not '{type(padding_right).__name__}'"
+            )
+
+        if not isinstance(alignment, enums.Alignment):
+            raise TypeError(
+                f"alignment should be of type '{enums.Alignment.__name__}' not '{type(alignment).__name__}'"
+            )
+        return padding_left, padding_right, alignment
+
     def insert(
         self,
         index,
@@ -1086,23 +1880,9 @@ class BTColumnCollection(object):
         ValueError:
             If length of `column` is shorter than number of rows.
         """
-        padding_left = self.default_padding if padding_left is None else padding_left
-        padding_right = self.default_padding if padding_right is None else padding_right
-        alignment = self.default_alignment if alignment is None else alignment
-        if not isinstance(padding_left, int):
-            raise TypeError(
-                f"'padding_left' should be of type 'int' not '{type(padding_left).__name__}'"
-            )
-
-        if not isinstance(padding_right, int):
-            raise TypeError(
-                f"'padding_right' should be of type 'int' not '{type(padding_right).__name__}'"
-            )
-
-        if not isinstance(alignment, enums.Alignment):
-            raise TypeError(
-                f"alignment should be of type '{enums.Alignment.__name__}' not '{type(alignment).__name__}'"
-            )
+        padding_left, padding_right, alignment = self._get_column_options(
+            padding_left, padding_right, alignment
+        )
 
         if self._table._ncol == 0:
             self.header = [header]
@@ -1112,31 +1892,27 @@ class BTColumnCollection(object):
             self._table._data = type(self._table._data)(
                 self._table, [BTRowData(self._table, [i]) for i in column]
             )
+            self._table.rows.header = [None] * len(self._table._data)
         else:
             if (not isinstance(header, basestring)) and (header is not None):
                 raise TypeError(
                     f"header must be of type 'str' not '{type(header).__name__}'"
                 )
-            column_length = 0
-            for row, new_item in zip(self._table.rows, column):
-                row._insert(index, new_item)
-                column_length += 1
-            if column_length == len(self._table.rows):
-                self._table._ncol += 1
-                self.header._insert(index, header)
-                self.width._insert(index, 0)
-                self.alignment._insert(index, alignment)
-                self.padding_left._insert(index, padding_left)
-                self.padding_right._insert(index, padding_right)
-                if self.header.alignment is not None:
-                    self.header.alignment._insert(index, alignment)
-            else:
-                # Roll back changes so that table remains in consistent state
-                for j in range(column_length, -1, -1):
-                    self._table.rows[j]._pop(index)
+            nrow = len(self._table.rows)
+            column = list(itertools.islice(column, nrow))
+            if len(column) < nrow:
                 raise ValueError(
-                    f"length of 'column' should be atleast {len(self._table.rows)}, got {column_length}"
+                    f"length of 'column' should be atleast {nrow}, got {len(column)}"
                 )
+            self._table._data._insert_column(index, column)
+            self._table._ncol += 1
+            self.header._insert(index, header)
+            self.width._insert(index, 0)
+            self.alignment._insert(index, alignment)
+            self.padding_left._insert(index, padding_left)
+            self.padding_right._insert(index, padding_right)
+            if self.header.alignment is not None:
+                self.header.alignment._insert(index, alignment)
 
     def append(
         self,
@@ -1173,3 +1949,218 @@ class BTColumnCollection(object):
             padding_right,
             alignment,
         )
+
+    def extend(
+        self,
+        columns,
+        header=None,
+        padding_left=None,
+        padding_right=None,
+        alignment=None,
+    ):
+        """Append all the columns from an iterable to the end of the table.
+
+        This is faster than calling :meth:`append` for every column, as the
+        rows are updated once for all the new columns. If the table is
+        empty, the number of rows is decided by the first column. If any
+        column is too short, the table is left unchanged.
+
+        Parameters
+        ----------
+        columns : iterable
+            Any iterable of columns, each of appropriate length.
+
+        header : iterable, optional
+            Headings of the columns.
+
+        padding_left : int, optional
+            Left padding of the new columns.
+
+        padding_right : int, optional
+            Right padding of the new columns.
+
+        alignment : Alignment, optional
+            alignment of the new columns.
+
+        Raises
+        ------
+        TypeError:
+            If any heading is not of type `str`.
+
+        ValueError:
+            If length of any column is shorter than number of rows, or if
+            length of `header` is different from number of columns.
+        """
+        padding_left, padding_right, alignment = self._get_column_options(
+            padding_left, padding_right, alignment
+        )
+        table = self._table
+        columns = [list(column) for column in columns]
+        if header is None:
+            header = [None] * len(columns)
+        else:
+            header = list(header)
+            if len(header) != len(columns):
+                raise ValueError(
+                    f"'Expected iterable of length {len(columns)}, got {len(header)}"
+                )
+            for item in header:
+                self.header._validate_item(item)
+        if not columns:
+            return
+
+        nrow = len(table._data) if table._ncol else len(columns[0])
+        for i, column in enumerate(columns):
+            if len(column) < nrow:
+                raise ValueError(
+                    f"length of 'column' should be atleast {nrow}, got {len(column)}"
+                )
+            if len(column) > nrow:
+                columns[i] = column[:nrow]
+
+        if table._ncol == 0:
+            table._data = type(table._data)(
+                table, [BTRowData._wrap(table, []) for i in range(nrow)]
+            )
+            table.rows.header = [None] * nrow
+
+        ncol = len(columns)
+        table._data._extend_columns(columns)
+        table._ncol += ncol
+        self.header._extend(header)
+        self.width._extend([0] * ncol)
+        self.alignment._extend([alignment] * ncol)
+        self.padding_left._extend([padding_left] * ncol)
+        self.padding_right._extend([padding_right] * ncol)
+        if self.header.alignment is not None:
+            self.header.alignment._extend([alignment] * ncol)
+
+    def _get_indices(self, keys):
+        """Return the non-negative indices of the columns `keys`."""
+        indices = range(len(self))
+        result = []
+        for key in keys:
+            if not isinstance(key, (int, basestring)):
+                raise TypeError(
+                    f"column indices must be int or str, not {type(key).__name__}"
+                )
+            result.append(indices[self._canonical_key(key)])
+        if len(set(result)) != len(result):
+            raise ValueError("columns must not be repeated")
+        return result
+
+    def _permute(self, order):
+        """Rearrange the metadata of the columns, such that the column at
+        `order[i]` moves to `i`. Columns not in `order` are removed.
+        """
+        self.header._permute(order)
+        if self.header.alignment is not None:
+            self.header.alignment._permute(order)
+        self.alignment._permute(order)
+        self.width._permute(order)
+        self.padding_left._permute(order)
+        self.padding_right._permute(order)
+        self._table._ncol = len(order)
+
+    def reorder(self, order):
+        """Reorder the columns of the table *IN-PLACE*.
+
+        Every row and the metadata of the columns, including the alignment
+        of the header, are rearranged in a single pass.
+
+        Parameters
+        ----------
+        order : iterable
+            index or header of every column, in the new order.
+
+        Raises
+        ------
+        TypeError:
+            If a column is not identified by an `int` or a `str`.
+
+        ValueError:
+            If `order` doesn't contain every column exactly once.
+        """
+        order = self._get_indices(order)
+        if len(order) != len(self):
+            raise ValueError("'order' must contain every column exactly once")
+        self._table._data._permute_columns(order)
+        self._permute(order)
+
+    def select(self, keys):
+        """Return a new table with only the columns `keys`, in that order.
+
+        Only the metadata of the table and the values of the selected
+        columns are copied, in a single pass over the rows.
+
+        Parameters
+        ----------
+        keys : iterable
+            index or header of the columns.
+
+        Returns
+        -------
+        BeautifulTable:
+            Table with the selected columns, keeping their metadata and the
+            row headers.
+
+        Raises
+        ------
+        TypeError:
+            If a column is not identified by an `int` or a `str`.
+
+        ValueError:
+            If no column is selected, or if a column is repeated.
+        """
+        order = self._get_indices(keys)
+        if not order:
+            # A table without columns can't keep the rows
+            raise ValueError("'keys' must contain at least one column")
+        table = self._table
+        new_table = table._copy_without_rows()
+        new_table._data._permute_columns(order)
+        new_table.columns._permute(order)
+        new_table.rows.extend(
+            [[row[j] for j in order] for row in table._data._itervalues()],
+            header=table.rows.header,
+        )
+        return new_table
+
+    def encode(self, key):
+        """Store a column as codes into a table of its distinct values.
+
+        This shrinks the memory used by columns which repeat a few values,
+        such as a status or a region, and such a column is formatted only
+        once per distinct value while rendering. Values which are added
+        later are encoded as well. It requires the table to use
+        ``STORAGE_COLUMNAR``.
+
+        Parameters
+        ----------
+        key : int, str
+            If `key` is int, column at index `key` is encoded.
+            If `key` is str, the first column with heading `key` is encoded.
+
+        Raises
+        ------
+        TypeError:
+            If the table doesn't use ``STORAGE_COLUMNAR``, or if any value
+            in the column is unhashable.
+        """
+        self._table._data._encode_column(self._canonical_key(key))
+
+    def decode(self, key):
+        """Store an encoded column as a plain list of values again.
+
+        Parameters
+        ----------
+        key : int, str
+            If `key` is int, column at index `key` is decoded.
+            If `key` is str, the first column with heading `key` is decoded.
+
+        Raises
+        ------
+        TypeError:
+            If the table doesn't use ``STORAGE_COLUMNAR``.
+        """
+        self._table._data._decode_column(self._canonical_key(key))
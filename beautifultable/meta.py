@@ -3,6 +3,8 @@ from .enums import Alignment
 
 
 class MetaData(BTBaseRow):
+    __slots__ = ()
+
     def __init__(self, table, row):
         for i in row:
             self.validate(i)
@@ -17,6 +19,8 @@ class MetaData(BTBaseRow):
 
 
 class AlignmentMetaData(MetaData):
+    __slots__ = ()
+
     def validate(self, value):
         if not isinstance(value, Alignment):
             allowed = (f"{type(self).__name__}.{i.name}" for i in Alignment)
@@ -30,6 +34,8 @@ class AlignmentMetaData(MetaData):
 
 
 class NonNegativeIntegerMetaData(MetaData):
+    __slots__ = ()
+
     def validate(self, value):
         if isinstance(value, int) and value >= 0:
             pass
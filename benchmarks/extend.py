@@ -0,0 +1,51 @@
+"""Measure the throughput of rows.extend against a loop of rows.append.
+
+Run from the root of the repository::
+
+    python benchmarks/extend.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from beautifultable import BeautifulTable  # noqa E402
+
+
+def append_loop(rows, storage=BeautifulTable.STORAGE_ROW):
+    table = BeautifulTable(storage=storage)
+    for row in rows:
+        table.rows.append(row)
+    return table
+
+
+def extend(rows, storage=BeautifulTable.STORAGE_ROW):
+    table = BeautifulTable(storage=storage)
+    table.rows.extend(rows)
+    return table
+
+
+def seconds(function, rows, storage, repeat=3):
+    """Return the best time of `repeat` runs of `function`."""
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        function(rows, storage)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+if __name__ == "__main__":
+    nrow = 100000
+    rows = [[i, f"name{i}", i * 0.5, i % 2 == 0] for i in range(nrow)]
+    for name in ("STORAGE_ROW", "STORAGE_COLUMNAR", "STORAGE_DEQUE", "STORAGE_SPARSE"):
+        storage = getattr(BeautifulTable, name)
+        for function in (append_loop, extend):
+            elapsed = seconds(function, rows, storage)
+            print(
+                f"{name} {function.__name__}: {elapsed:.3f}s"
+                f" (~{nrow / elapsed / 1000:.0f}k rows/s)"
+            )
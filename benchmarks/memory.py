@@ -0,0 +1,33 @@
+"""Measure the memory used per row of a table.
+
+Run from the root of the repository::
+
+    python benchmarks/memory.py
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+from beautifultable import BeautifulTable  # noqa E402
+
+
+def bytes_per_row(nrow=100000, storage=BeautifulTable.STORAGE_ROW):
+    rows = [[i, i, i] for i in range(nrow)]
+    table = BeautifulTable(storage=storage)
+    table.rows.append(rows[0])
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for row in rows[1:]:
+        table.rows.append(row)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / (nrow - 1)
+
+
+if __name__ == "__main__":
+    for name in ("STORAGE_ROW", "STORAGE_COLUMNAR", "STORAGE_DEQUE", "STORAGE_SPARSE"):
+        size = bytes_per_row(storage=getattr(BeautifulTable, name))
+        print(f"{name}: {size:.1f} bytes/row")
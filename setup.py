@@ -7,7 +7,7 @@ from setuptools import setup
 install_requires = ["wcwidth"]
 
 extras_require = {
-    "dev": ["pandas"],
+    "dev": ["pandas", "numpy"],
 }
 
 extras_require["all"] = list(
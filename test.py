@@ -2,6 +2,8 @@
 
 
 import os
+import csv
+import copy
 import unittest
 import itertools
 
@@ -17,6 +19,16 @@ else:
 
 REQUIRED_PANDAS_MESSAGE = "requires 'pandas' to be installed"
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+    NUMPY_INSTALLED = False
+else:
+    NUMPY_INSTALLED = True
+
+REQUIRED_NUMPY_MESSAGE = "requires 'numpy' to be installed"
+
 
 class TableOperationsTestCase(unittest.TestCase):
     def setUp(self):
@@ -55,6 +67,13 @@ class TableOperationsTestCase(unittest.TestCase):
         ]
         for row_t, row in zip(new_table.rows, rows):
             self.compare_iterable(row_t, row)
+        self.assertEqual(new_table.rows.header, ["S3", "S4", "S5"])
+        self.assertEqual(new_table.columns.header, self.table.columns.header)
+
+        calls = []
+        new_table = self.table.rows.filter(lambda x: calls.append(x) or False)
+        self.assertEqual(len(calls), 5)
+        self.assertEqual(new_table.shape, (0, 3))
 
     def test_sort_by_index(self):
         self.table.rows.sort(0)
@@ -322,6 +341,14 @@ class TableOperationsTestCase(unittest.TestCase):
         new_table = self.table.rows[:3]
         self.assertEqual(len(new_table.rows), 3)
         self.assertEqual(len(self.table.rows), 5)
+        self.table.columns.alignment["rank"] = self.table.ALIGN_LEFT
+        new_table = self.table.rows[::-2]
+        self.assertEqual(new_table.rows.header, ["S5", "S3", "S1"])
+        self.assertEqual(new_table.columns.alignment[1], self.table.ALIGN_LEFT)
+        new_table.rows[0][0] = "Mike"
+        new_table.columns.width = 10
+        self.assertEqual(self.table.rows[4][0], "Michael")
+        self.assertNotEqual(self.table.columns.width[0], 10)
 
     def test_row_delitem_int(self):
         del self.table.rows[1]
@@ -860,6 +887,662 @@ class TableOperationsTestCase(unittest.TestCase):
         self.assertEqual(list(df.index), [0, 1])
         self.assertEqual(list(df.columns), [None, "rank", "gender"])
 
+    def test_freeze(self):
+        string = str(self.table)
+        frozen = self.table.freeze()
+        self.assertEqual(str(frozen), string)
+        self.assertEqual(frozen.shape, (5, 3))
+        self.assertEqual(frozen.header, ("name", "rank", "gender"))
+        self.assertEqual(frozen.rows[1], ("Isabella", 1, "girl"))
+        self.table.rows.append(["Ava", 4, "girl"])
+        self.assertEqual(str(frozen), string)
+
+    def test_freeze_immutable(self):
+        frozen = self.table.freeze()
+        with self.assertRaises(AttributeError):
+            frozen._string = ""
+        self.assertIs(copy.copy(frozen), frozen)
+        self.assertIs(copy.deepcopy(frozen), frozen)
+
+    def test_freeze_hashable(self):
+        frozen1 = self.table.freeze()
+        frozen2 = self.table.freeze()
+        self.assertEqual(frozen1, frozen2)
+        self.assertEqual(hash(frozen1), hash(frozen2))
+        self.table.rows[0][0] = "John"
+        self.assertNotEqual(frozen1, self.table.freeze())
+
+    def test_columnar_storage(self):
+        string = str(self.table)
+        self.table.storage = self.table.STORAGE_COLUMNAR
+        self.assertEqual(self.table.storage, self.table.STORAGE_COLUMNAR)
+        self.assertEqual(str(self.table), string)
+        self.compare_iterable(self.table.rows["S2"], ["Isabella", 1, "girl"])
+        self.table.rows[1][0] = "Bella"
+        self.assertEqual(self.table.columns["name"][1], "Bella")
+        self.table.storage = self.table.STORAGE_ROW
+        self.compare_iterable(self.table.rows[1], ["Bella", 1, "girl"])
+
+    def test_columnar_column_operations(self):
+        table = BeautifulTable(storage=BeautifulTable.STORAGE_COLUMNAR)
+        table.columns.append(["Jacob", "Isabella"], header="name")
+        table.columns.append([1, 2], header="rank")
+        table.columns.insert(1, ["boy", "girl"], header="gender")
+        self.compare_iterable(table.rows[1], ["Isabella", "girl", 2])
+        self.compare_iterable(table.columns.pop("gender"), ["boy", "girl"])
+        table.rows.append(["Ethan", 3])
+        table.rows.sort("rank", reverse=True)
+        self.compare_iterable(table.columns["name"], ["Ethan", "Isabella", "Jacob"])
+        with self.assertRaises(ValueError):
+            table.columns.append([1, 2])
+        self.assertEqual(table.shape, (3, 2))
+
+    def test_storage_raises_exception(self):
+        with self.assertRaises(ValueError):
+            self.table.storage = "columnar"
+        with self.assertRaises(ValueError):
+            BeautifulTable(storage="columnar")
+
+    @unittest.skipUnless(NUMPY_INSTALLED, REQUIRED_NUMPY_MESSAGE)
+    def test_numpy_import(self):
+        array = np.arange(6).reshape(3, 2)
+        table = BeautifulTable().from_numpy(array, headers=["a", "b"])
+        self.assertEqual(table.shape, (3, 2))
+        self.assertEqual(table.columns.header, ["a", "b"])
+        self.compare_iterable(table.rows[1], [2, 3])
+        self.compare_iterable(table.columns["b"], [1, 3, 5])
+        table.rows[0][0] = 10
+        table.rows.append([6, 7])
+        self.compare_iterable(table.columns["a"], [10, 2, 4, 6])
+        self.assertEqual(array[0, 0], 0)
+
+    @unittest.skipUnless(NUMPY_INSTALLED, REQUIRED_NUMPY_MESSAGE)
+    def test_numpy_import_structured(self):
+        array = np.array(
+            [("Jacob", 1), ("Isabella", 2)], dtype=[("name", "U10"), ("rank", int)]
+        )
+        table = BeautifulTable().from_numpy(array)
+        string = """+----------+------+
+|   name   | rank |
++----------+------+
+|  Jacob   |  1   |
++----------+------+
+| Isabella |  2   |
++----------+------+"""
+        self.assertEqual(string, str(table))
+        with self.assertRaises(ValueError):
+            table.from_numpy(np.arange(3))
+
+    def test_row_adopt(self):
+        rows = [("Ava", 4, "girl"), ("Liam", 5, "boy"), ("Emma", 6, "girl")]
+        self.table.rows.adopt(rows, header=["S6", "S7", "S8"])
+        self.assertEqual(self.table.shape, (3, 3))
+        self.assertEqual(self.table.columns.header, ["name", "rank", "gender"])
+        self.assertEqual(len(self.table._data._cache), 0)
+        self.compare_iterable(self.table.rows["S7"], ["Liam", 5, "boy"])
+        self.table.rows[0][1] = 10
+        self.compare_iterable(self.table.columns["rank"], [10, 5, 6])
+        self.table.rows.insert(0, ["Noah", 7, "boy"])
+        self.compare_iterable(self.table.rows[1], ["Ava", 10, "girl"])
+        self.assertEqual(rows[0], ("Ava", 4, "girl"))
+
+    def test_row_adopt_empty_table(self):
+        table = BeautifulTable()
+        table.rows.adopt([(1, 2), (3, 4), (5,)])
+        self.assertEqual(table.shape, (3, 2))
+        self.compare_iterable(table.rows[1], [3, 4])
+        with self.assertRaises(ValueError):
+            table.rows[2]
+
+    def test_row_adopt_lengths(self):
+        for storage in (
+            BeautifulTable.STORAGE_COLUMNAR,
+            BeautifulTable.STORAGE_SPARSE,
+        ):
+            table = BeautifulTable(storage=storage)
+            table.columns.header = ["a", "b"]
+            table.rows.append([1, 2])
+            for rows in ([(1, 2), (3,)], [(1, 2), (3, 4, 5)]):
+                with self.assertRaises(ValueError):
+                    table.rows.adopt(rows)
+                self.assertEqual(table.shape, (1, 2))
+            with self.assertRaises(ValueError):
+                table.rows.adopt([(1, 2)], header=["x", "y"])
+            self.assertEqual(table.shape, (1, 2))
+            table.rows.adopt([])
+            self.assertEqual(table.shape, (0, 2))
+            table.rows.append([3, 4])
+            self.compare_iterable(table.columns["b"], [4])
+            table = BeautifulTable(storage=storage)
+            with self.assertRaises(ValueError):
+                table.rows.adopt([(1, 2), (3,)])
+            self.assertEqual(table.shape, (0, 0))
+
+    def test_row_adopt_render_row_header(self):
+        rows = [("Ava", 4, "girl"), ("Liam", 5, "boy")]
+        self.table.rows.adopt(rows, header=["S6", "S7"])
+        table = BeautifulTable()
+        table.columns.header = ["name", "rank", "gender"]
+        table.rows.extend(rows, header=["S6", "S7"])
+        self.assertEqual(str(self.table), str(table))
+        self.assertIn("| S7 | Liam |", str(self.table))
+        self.assertEqual(len(self.table._data._cache), 0)
+        self.assertEqual(self.table.shape, (2, 3))
+
+    def test_row_extend(self):
+        rows = [["Ava", 4, "girl"], ["Liam", 5, "boy"]]
+        self.table.rows.extend(rows, header=["S6", "S7"])
+        self.assertEqual(len(self.table.rows), 7)
+        self.compare_iterable(self.table.rows["S7"], ["Liam", 5, "boy"])
+        with self.assertRaises(ValueError):
+            self.table.rows.extend([["Emma", 6, "girl"], ["Noah", 7]])
+        with self.assertRaises(ValueError):
+            self.table.rows.extend([["Emma", 6, "girl"]], header=["S8", "S9"])
+        self.assertEqual(len(self.table.rows), 7)
+        self.assertEqual(len(self.table.rows.header), 7)
+
+    def test_row_extend_empty_table(self):
+        for storage in (BeautifulTable.STORAGE_ROW, BeautifulTable.STORAGE_COLUMNAR):
+            table = BeautifulTable(storage=storage)
+            table.rows.extend(iter([(1, 2), (3, 4)]))
+            self.assertEqual(table.shape, (2, 2))
+            self.compare_iterable(table.columns[1], [2, 4])
+
+    def test_column_extend(self):
+        self.table.columns.extend(
+            [[10, 20, 30, 40, 50], ["a", "b", "c", "d", "e", "f"]],
+            header=["score", "grade"],
+            alignment=self.table.ALIGN_LEFT,
+        )
+        self.assertEqual(self.table.shape, (5, 5))
+        self.compare_iterable(self.table.rows[1], ["Isabella", 1, "girl", 20, "b"])
+        self.assertEqual(self.table.columns.alignment[4], self.table.ALIGN_LEFT)
+        with self.assertRaises(ValueError):
+            self.table.columns.extend([[1, 2, 3, 4, 5], [1, 2]])
+        self.assertEqual(self.table.shape, (5, 5))
+
+    def test_from_columns(self):
+        for storage in (BeautifulTable.STORAGE_ROW, BeautifulTable.STORAGE_COLUMNAR):
+            table = BeautifulTable(storage=storage)
+            table.from_columns({"name": ["Jacob", "Isabella"], "rank": [1, 2]})
+            self.assertEqual(table.shape, (2, 2))
+            self.assertEqual(table.columns.header, ["name", "rank"])
+            self.assertEqual(table.rows.header, [None, None])
+            self.compare_iterable(table.rows[1], ["Isabella", 2])
+
+    def test_deque_storage(self):
+        table = BeautifulTable(storage=BeautifulTable.STORAGE_DEQUE)
+        table.columns.header = ["event", "id"]
+        for i in range(5):
+            table.rows.insert(0, ["event{}".format(i), i], header="E{}".format(i))
+        self.compare_iterable(table.columns["id"], [4, 3, 2, 1, 0])
+        self.compare_iterable(table.rows.header, ["E4", "E3", "E2", "E1", "E0"])
+        self.compare_iterable(table.rows.pop(0), ["event4", 4])
+        self.compare_iterable(table.rows["E1"], ["event1", 1])
+        table.rows.reverse()
+        self.compare_iterable(table.columns["id"], [0, 1, 2, 3])
+        self.assertEqual(table.rows[1:3].shape, (2, 2))
+
+    def test_header_index(self):
+        self.table.rows.insert(0, ["Ava", 4, "girl"], header="S3")
+        self.compare_iterable(self.table.rows["S3"], ["Ava", 4, "girl"])
+        self.assertEqual(self.table.rows.header.index("S5"), 5)
+        self.table.rows.pop(0)
+        self.compare_iterable(self.table.rows["S3"], ["Ethan", 2, "boy"])
+        self.table.rows.reverse()
+        self.assertEqual(self.table.rows.header.index("S1"), 4)
+        self.compare_iterable(self.table.rows["S1"], ["Jacob", 1, "boy"])
+        self.table.rows.sort("name")
+        self.compare_iterable(self.table.rows["S4"], ["Sophia", 2, "girl"])
+        self.table.rows.header[0] = "S0"
+        self.assertTrue("S0" in self.table.rows.header)
+        self.assertFalse("S3" in self.table.rows.header)
+        with self.assertRaises(KeyError):
+            self.table.rows["S3"]
+
+    def test_column_header_index(self):
+        self.table.columns.insert(0, [1, 2, 3, 4, 5], header="rank")
+        self.compare_iterable(self.table.columns["rank"], [1, 2, 3, 4, 5])
+        self.assertEqual(self.table.rows[1]["gender"], "girl")
+        del self.table.columns["rank"]
+        self.compare_iterable(self.table.columns["rank"], [1, 1, 2, 2, 3])
+        self.table.columns.header[1] = "score"
+        self.assertEqual(self.table.rows[4]["score"], 3)
+        self.assertFalse("rank" in self.table.columns.header)
+        self.table.columns.header.value[0] = "first"
+        self.assertEqual(self.table.rows[0]["first"], "Jacob")
+        with self.assertRaises(KeyError):
+            self.table.rows[0]["name"]
+        self.table.rows.header.value[0] = "S0"
+        self.compare_iterable(self.table.rows["S0"], ["Jacob", 1, "boy"])
+
+    def test_csv_import_lazy(self):
+        self.table.rows.append(["Noah\nJr.", 6, 'the "boy"'])
+        self.table.to_csv("beautiful_table.csv")
+
+        test_table = BeautifulTable()
+        test_table.from_csv("beautiful_table.csv", lazy=True)
+        rows = test_table._data._value
+        self.assertEqual(self.table.columns.header, test_table.columns.header)
+        self.assertEqual(len(test_table.rows), 6)
+        self.compare_iterable(test_table.rows[-1], ["Noah\nJr.", "6", 'the "boy"'])
+        window = test_table.rows[1:3]
+        self.assertEqual(len(window.rows), 2)
+        self.compare_iterable(window.rows[1], ["Ethan", "2", "boy"])
+        test_table.rows[0][1] = 8
+        test_table.rows.insert(0, ["Ava", 4, "girl"])
+        self.assertEqual(test_table.rows[1]["rank"], 8)
+        with self.assertRaises(ValueError):
+            test_table.from_csv("beautiful_table.csv", lazy=True)
+        rows.close()
+
+        with open("beautiful_table.csv", "a", newline="") as csv_file:
+            csv_file.write('5" pipe,x,y\n6,z,w\n')
+        test_table = BeautifulTable()
+        test_table.from_csv("beautiful_table.csv", header=False)
+        lazy_table = BeautifulTable()
+        lazy_table.from_csv("beautiful_table.csv", header=False, lazy=True)
+        self.assertEqual(len(lazy_table.rows), 9)
+        self.assertEqual(
+            list(map(list, lazy_table.rows)), list(map(list, test_table.rows))
+        )
+        lazy_table._data._value.close()
+
+        # Teardown step.
+        os.remove("beautiful_table.csv")
+
+    def test_csv_import_lazy_persist_index(self):
+        self.table.to_csv("beautiful_table.csv")
+        test_table = BeautifulTable()
+        test_table.from_csv("beautiful_table.csv", lazy=True, persist_index=True)
+        test_table._data._value.close()
+        self.assertTrue(os.path.exists("beautiful_table.csv.idx"))
+
+        test_table = BeautifulTable()
+        test_table.from_csv("beautiful_table.csv", lazy=True, persist_index=True)
+        self.compare_iterable(test_table.rows[3], ["Sophia", "2", "girl"])
+        test_table._data._value.close()
+
+        # Teardown step.
+        os.remove("beautiful_table.csv")
+        os.remove("beautiful_table.csv.idx")
+
+    def test_csv_import_lazy_persist_index_format(self):
+        with open("beautiful_table.csv", "w", newline="") as csv_file:
+            csv_file.write('a,b\n"x\ny",1\n3,4\n')
+        test_table = BeautifulTable()
+        test_table.from_csv(
+            "beautiful_table.csv",
+            lazy=True,
+            persist_index=True,
+            quoting=csv.QUOTE_NONE,
+        )
+        self.assertEqual(len(test_table.rows), 3)
+        test_table._data._value.close()
+
+        test_table = BeautifulTable()
+        test_table.from_csv("beautiful_table.csv", lazy=True, persist_index=True)
+        self.assertEqual(len(test_table.rows), 2)
+        self.compare_iterable(test_table.rows[0], ["x\ny", "1"])
+        test_table._data._value.close()
+
+        # Teardown step.
+        os.remove("beautiful_table.csv")
+        os.remove("beautiful_table.csv.idx")
+
+    def test_column_encode(self):
+        table = BeautifulTable(storage=BeautifulTable.STORAGE_COLUMNAR)
+        table.rows.extend(self.table.rows, header=self.table.rows.header)
+        table.columns.header = self.table.columns.header
+        table.columns.encode("gender")
+        table.columns.encode(1)
+        table.rows.append(["Ava", 4, "girl"], header="S6")
+        table.rows[0]["gender"] = "girl"
+        table.rows.sort("name")
+        self.table.rows.append(["Ava", 4, "girl"], header="S6")
+        self.table.rows[0]["gender"] = "girl"
+        self.table.rows.sort("name")
+        self.assertEqual(str(table), str(self.table))
+        self.compare_iterable(table.columns["rank"], [4, 2, 1, 1, 3, 2])
+        table.columns.decode("gender")
+        self.assertEqual(str(table), str(self.table))
+        with self.assertRaises(TypeError):
+            self.table.columns.encode("gender")
+        table.columns.encode("gender")
+        with self.assertRaises(TypeError):
+            table.rows.append(["Noah", 7, ["boy"]])
+        self.assertEqual(len(table.rows), 6)
+        self.assertEqual(len(table.columns["name"]), 6)
+        table.columns.decode("rank")
+        table.rows.append(["Noah", [7], "boy"])
+        with self.assertRaises(TypeError):
+            table.columns.encode("rank")
+
+    def test_sparse_storage(self):
+        self.table.rows.append([None, 4, None], header="S6")
+        string = str(self.table)
+        self.table.storage = self.table.STORAGE_SPARSE
+        self.assertEqual(str(self.table), string)
+        self.assertEqual(self.table._data._rows[5], {1: 4})
+        self.table.rows[5]["name"] = "Ava"
+        self.table.rows[0][2] = None
+        self.compare_iterable(self.table.columns["gender"][:2], [None, "girl"])
+        self.table.columns.insert(1, [None, 2, None, None, None, 6], header="age")
+        self.table.columns.append([None] * 6, header="notes")
+        self.compare_iterable(self.table.rows[5], ["Ava", 6, 4, None, None])
+        self.compare_iterable(self.table.columns.pop("rank"), [1, 1, 2, 2, 3, 4])
+        del self.table.columns[-1]
+        self.compare_iterable(self.table.rows[1], ["Isabella", 2, "girl"])
+        self.table.storage = self.table.STORAGE_ROW
+        self.compare_iterable(self.table.rows[0], ["Jacob", None, None])
+
+    def test_sort_multiple_keys(self):
+        self.table.rows.append([None, 2, "boy"], header="S6")
+        self.table.rows.sort(["rank", "name"], reverse=[True, False])
+        self.assertEqual(self.table.rows.header, ["S5", "S3", "S4", "S6", "S2", "S1"])
+        self.compare_iterable(self.table.rows["S6"], [None, 2, "boy"])
+        self.table.rows.sort("name", reverse=True)
+        self.compare_iterable(
+            self.table.columns["name"],
+            ["Sophia", "Michael", "Jacob", "Isabella", "Ethan", None],
+        )
+        self.table.rows.sort(lambda row: row["gender"] + str(row["rank"]))
+        self.assertEqual(self.table.rows.header[:3], ["S1", "S3", "S6"])
+        with self.assertRaises(ValueError):
+            self.table.rows.sort(["rank", "name"], reverse=[True])
+        with self.assertRaises(TypeError):
+            self.table.rows.sort([1.0])
+
+    def test_row_nlargest_nsmallest(self):
+        self.table.rows.append(["Ava", None, "girl"], header="S6")
+        table = self.table.rows.nlargest(3, "rank")
+        self.assertEqual(table.rows.header, ["S5", "S3", "S4"])
+        self.assertEqual(table.columns.header, self.table.columns.header)
+        self.compare_iterable(table.rows[0], ["Michael", 3, "boy"])
+        table = self.table.rows.nsmallest(2, lambda row: row["name"])
+        self.assertEqual(table.rows.header, ["S6", "S3"])
+        table = self.table.rows.nsmallest(10, "rank")
+        self.assertEqual(len(table.rows), 6)
+        self.assertEqual(table.rows.header[-1], "S6")
+        self.assertEqual(len(self.table.rows), 6)
+        self.table.storage = self.table.STORAGE_COLUMNAR
+        table = self.table.rows.nlargest(1, 1)
+        self.compare_iterable(table.rows["S5"], ["Michael", 3, "boy"])
+        self.assertEqual(table.storage, self.table.STORAGE_COLUMNAR)
+
+    def test_row_hash_index(self):
+        self.assertTrue(["Ethan", 2, "boy"] in self.table.rows)
+        self.assertEqual(self.table.rows.index(("Sophia", 2, "girl")), 3)
+        self.table.rows.append(["Ava", 4, "girl"])
+        self.assertEqual(self.table.rows.index(["Ava", 4, "girl"]), 5)
+        self.table.rows[2]["rank"] = 7
+        self.assertFalse(["Ethan", 2, "boy"] in self.table.rows)
+        self.assertTrue(["Ethan", 7, "boy"] in self.table.rows)
+        self.table.rows.insert(0, ["Ethan", 7, "boy"])
+        self.assertEqual(self.table.rows.index(["Ethan", 7, "boy"]), 0)
+        self.assertEqual(self.table.rows.index(["Ethan", 7, "boy"], 1), 3)
+        self.table.columns.pop("rank")
+        self.assertTrue(["Ava", "girl"] in self.table.rows)
+        self.table.rows.append([["Noah"], "boy"])
+        self.assertEqual(self.table.rows.index([["Noah"], "boy"]), 7)
+        with self.assertRaises(KeyError):
+            self.table.rows.index(["Noah", "boy"])
+
+    def test_row_groupby(self):
+        self.table.rows.append(["Ava", None, "girl"])
+        table = self.table.rows.groupby("gender").agg(
+            {
+                "count": ("name", "count"),
+                "total": ("rank", "sum"),
+                "mean": (1, "mean"),
+                "last": ("name", "last"),
+                "names": ("name", lambda names: "/".join(names)),
+            }
+        )
+        self.assertEqual(
+            table.columns.header, ["gender", "count", "total", "mean", "last", "names"]
+        )
+        self.compare_iterable(
+            table.rows[0], ["boy", 3, 6, 2, "Michael", "Jacob/Ethan/Michael"]
+        )
+        self.compare_iterable(
+            table.rows[1], ["girl", 3, 3, 1.5, "Ava", "Isabella/Sophia/Ava"]
+        )
+
+        rows = iter([["Liam", 4, "boy"], ["Emma", 4, "girl"], ["Noah", 5, "boy"]])
+        table = self.table.rows.groupby(["rank", lambda row: row["gender"]]).agg(
+            {"first": ("name", "first"), "max": ("name", "max")}, rows=rows
+        )
+        self.assertEqual(table.shape, (3, 4))
+        self.compare_iterable(table.rows[2], [5, "boy", "Noah", "Noah"])
+        with self.assertRaises(ValueError):
+            self.table.rows.groupby("gender").agg({"x": ("rank", "median")})
+        with self.assertRaises(TypeError):
+            self.table.rows.groupby(1.0)
+
+    def test_row_drop_duplicates(self):
+        self.table.rows.append(["Ethan", 2, "boy"], header="S6")
+        self.table.rows.append(["Ava", 1, "girl"], header="S7")
+        self.assertEqual(self.table.rows.drop_duplicates(), 1)
+        self.assertEqual(self.table.rows.header, ["S1", "S2", "S3", "S4", "S5", "S7"])
+        self.assertEqual(
+            self.table.rows.drop_duplicates(["rank", "gender"], keep="last"), 1
+        )
+        self.assertEqual(self.table.rows.header, ["S1", "S3", "S4", "S5", "S7"])
+        self.compare_iterable(self.table.rows[-1], ["Ava", 1, "girl"])
+        self.table.storage = self.table.STORAGE_COLUMNAR
+        self.assertEqual(self.table.rows.drop_duplicates("rank", keep=False), 4)
+        self.assertEqual(self.table.rows.header, ["S5"])
+        self.compare_iterable(self.table.columns["name"], ["Michael"])
+        self.assertEqual(self.table.rows.drop_duplicates(), 0)
+        with self.assertRaises(ValueError):
+            self.table.rows.drop_duplicates(keep="all")
+
+    def test_row_searchsorted_range(self):
+        self.assertEqual(self.table.rows.searchsorted("rank", 2), 2)
+        self.assertEqual(self.table.rows.searchsorted(1, 2, side="right"), 4)
+        table = self.table.rows.range("rank", 2)
+        self.assertEqual(table.rows.header, ["S3", "S4", "S5"])
+        table = self.table.rows.range("rank", 1, 3)
+        self.assertEqual(table.rows.header, ["S1", "S2", "S3", "S4"])
+        self.table.rows.append(["Ava", 4, "girl"], header="S6")
+        self.table.rows.append(["Noah", None, "boy"], header="S7")
+        self.assertIn(1, self.table._data._sorted_columns)
+        self.assertEqual(self.table.rows.searchsorted("rank", 5), 6)
+        self.assertEqual(self.table.rows.range("rank", 3).rows.header, ["S5", "S6"])
+        self.table.rows.append(["Liam", 0, "boy"], header="S8")
+        with self.assertRaises(ValueError):
+            self.table.rows.searchsorted("rank", 2)
+        self.table.rows.sort("rank")
+        self.assertEqual(self.table.rows.searchsorted("rank", 1), 1)
+        self.table.rows[0]["rank"] = 9
+        with self.assertRaises(ValueError):
+            self.table.rows.range("rank", 1, 2)
+        self.table.storage = self.table.STORAGE_COLUMNAR
+        self.table.rows.sort("name")
+        self.assertEqual(self.table.rows.searchsorted("name", "Jacob"), 3)
+        with self.assertRaises(ValueError):
+            self.table.rows.searchsorted("name", "Jacob", side="middle")
+
+    def test_row_value_modified(self):
+        self.assertIn(["Jacob", 1, "boy"], self.table.rows)
+        self.assertEqual(self.table.rows.searchsorted("rank", 2), 2)
+        self.table.rows[0].value[1] = 9
+        self.assertNotIn(["Jacob", 1, "boy"], self.table.rows)
+        self.assertIn(["Jacob", 9, "boy"], self.table.rows)
+        with self.assertRaises(ValueError):
+            self.table.rows.searchsorted("rank", 2)
+        with self.assertRaises(ValueError):
+            self.table.rows.range("rank", 1, 2)
+
+    def test_join(self):
+        other = BeautifulTable()
+        other.columns.header = ["gender", "title"]
+        other.rows.append(["girl", "Ms"])
+        other.rows.append(["boy", "Mr"])
+        other.rows.append(["boy", "Sir"])
+        other.columns.alignment["title"] = BeautifulTable.ALIGN_LEFT
+        other.columns.padding_right["title"] = 3
+        table = self.table.join(other, on="gender")
+        self.assertEqual(table.columns.header, ["name", "rank", "gender", "title"])
+        self.assertEqual(
+            table.rows.header, ["S1", "S1", "S2", "S3", "S3", "S4", "S5", "S5"]
+        )
+        self.compare_iterable(table.rows[1], ["Jacob", 1, "boy", "Sir"])
+        self.compare_iterable(table.rows[2], ["Isabella", 1, "girl", "Ms"])
+        self.assertEqual(table.columns.alignment["title"], BeautifulTable.ALIGN_LEFT)
+        self.assertEqual(table.columns.padding_right["title"], 3)
+
+        other.rows.pop(0)
+        other.rows.append([None, "Dr"])
+        other.rows.append(["boy", "Lord"])
+        other.rows.append(["boy", "Dude"])
+        other.rows.append(["boy", "Mx"])
+        other.rows.append(["boy", "Mate"])
+        table = self.table.join(other, on=["gender"], how="left")
+        self.assertEqual(len(table.rows), 3 * 6 + 2)
+        self.assertEqual(table.rows.header[6:8], ["S2", "S3"])
+        self.compare_iterable(table.rows[6], ["Isabella", 1, "girl", None])
+        table = self.table.join(other, "gender")
+        self.assertEqual(len(table.rows), 18)
+        with self.assertRaises(KeyError):
+            self.table.join(other, on="name")
+        with self.assertRaises(ValueError):
+            self.table.join(other, on="gender", how="outer")
+
+    def test_join_width(self):
+        other = BeautifulTable()
+        other.columns.header = ["gender", "title"]
+        other.rows.append(["boy", "Mr"])
+        str(other)
+        self.table.columns.width = [10, 6, 8]
+        table = self.table.join(other, on="gender")
+        self.assertEqual(table.columns.width, [10, 6, 8, 7])
+        str(table)
+        self.assertEqual(table.columns.width, [10, 6, 8, 7])
+
+    def test_row_delete_many(self):
+        del self.table.rows[[0, "S3", -1, 0]]
+        self.assertEqual(self.table.rows.header, ["S2", "S4"])
+        self.compare_iterable(self.table.columns["name"], ["Isabella", "Sophia"])
+        with self.assertRaises(IndexError):
+            del self.table.rows[[5]]
+        with self.assertRaises(KeyError):
+            del self.table.rows[["S1"]]
+        with self.assertRaises(TypeError):
+            del self.table.rows[[1.0]]
+        self.assertEqual(len(self.table.rows), 2)
+        del self.table.rows[[]]
+        self.assertEqual(len(self.table.rows), 2)
+
+    def test_row_remove_where(self):
+        self.table.storage = self.table.STORAGE_COLUMNAR
+        self.assertEqual(self.table.rows.remove_where(lambda row: row["rank"] == 2), 2)
+        self.assertEqual(self.table.rows.header, ["S1", "S2", "S5"])
+        self.compare_iterable(self.table.rows[-1], ["Michael", 3, "boy"])
+        self.assertEqual(self.table.rows.remove_where(lambda row: False), 0)
+        self.assertEqual(self.table.rows.remove_where(lambda row: True), 3)
+        self.assertEqual(self.table.shape, (0, 3))
+
+    def test_row_insort(self):
+        self.assertEqual(
+            self.table.rows.insort(["Ava", 2, "girl"], "rank", header="S6"), 4
+        )
+        self.assertEqual(self.table.rows.header, ["S1", "S2", "S3", "S4", "S6", "S5"])
+        self.assertEqual(self.table.rows.insort(["Noah", None, "boy"], 1), 6)
+        self.assertEqual(self.table.rows.insort(["Liam", 5, "boy"], "rank"), 6)
+        self.assertEqual(self.table.rows.insort(["Emma", 0, "girl"], "rank"), 0)
+        self.compare_iterable(
+            self.table.columns["rank"], [0, 1, 1, 2, 2, 2, 3, 5, None]
+        )
+        self.assertEqual(self.table.rows.searchsorted("rank", 3), 6)
+        self.assertIn(1, self.table._data._sorted_columns)
+        self.table.rows.insort(["Mia", 4, "girl"], "rank")
+        self.table.rows.reverse()
+        with self.assertRaises(ValueError):
+            self.table.rows.insort(["Mia", 4, "girl"], "rank")
+        self.table.rows.sort("name")
+        with self.assertRaises(ValueError):
+            self.table.rows.insort(["Mia", 4], "name")
+        self.assertEqual(len(self.table.rows.header), 10)
+        table = BeautifulTable()
+        with self.assertRaises(ValueError):
+            table.rows.insort(["Mia", 4, "girl"], 1)
+        self.assertEqual(table.shape, (0, 0))
+        table.columns.header = ["name", "rank"]
+        self.assertEqual(table.rows.insort(["Mia", 4], "rank"), 0)
+
+    def test_column_reorder_select(self):
+        self.table.columns.alignment["rank"] = BeautifulTable.ALIGN_LEFT
+        self.table.columns.padding_right["name"] = 3
+        self.table.columns.header.alignment = BeautifulTable.ALIGN_RIGHT
+        self.table.columns.header.alignment["gender"] = BeautifulTable.ALIGN_CENTER
+        self.table.columns.reorder(["gender", 0, "rank"])
+        self.assertEqual(self.table.columns.header, ["gender", "name", "rank"])
+        self.compare_iterable(self.table.rows["S2"], ["girl", "Isabella", 1])
+        self.assertEqual(self.table.columns.alignment[2], BeautifulTable.ALIGN_LEFT)
+        self.assertEqual(self.table.columns.padding_right["name"], 3)
+        self.assertEqual(
+            self.table.columns.header.alignment[0], BeautifulTable.ALIGN_CENTER
+        )
+        self.assertEqual(self.table.columns.header.index("rank"), 2)
+        with self.assertRaises(ValueError):
+            self.table.columns.reorder(["gender", "name"])
+        with self.assertRaises(ValueError):
+            self.table.columns.reorder(["gender", "name", 0])
+
+        self.table.storage = self.table.STORAGE_COLUMNAR
+        table = self.table.columns.select(["rank", "gender"])
+        self.assertEqual(table.columns.header, ["rank", "gender"])
+        self.assertEqual(table.rows.header, self.table.rows.header)
+        self.compare_iterable(table.rows[1], [1, "girl"])
+        self.assertEqual(table.columns.alignment[0], BeautifulTable.ALIGN_LEFT)
+        self.assertEqual(table.storage, self.table.STORAGE_COLUMNAR)
+        self.assertEqual(self.table.shape, (5, 3))
+        self.table.storage = self.table.STORAGE_SPARSE
+        self.table.columns.reorder([2, 1, 0])
+        self.compare_iterable(self.table.rows[0], [1, "Jacob", "boy"])
+        with self.assertRaises(ValueError):
+            self.table.columns.select([])
+        self.assertEqual(self.table.columns.select(["name"]).shape, (5, 1))
+
+    def test_column_view(self):
+        column = self.table.columns["rank"]
+        self.assertEqual(column, [1, 1, 2, 2, 3])
+        snapshot = column.copy()
+        self.table.rows[0]["rank"] = 7
+        self.table.rows.append(["Ava", 4, "girl"])
+        self.assertEqual(column[0], 7)
+        self.assertEqual(column[-1], 4)
+        self.assertEqual(column["S2"], 1)
+        self.assertEqual(column.aslist(), [7, 1, 2, 2, 3, 4])
+        self.assertEqual(snapshot, [1, 1, 2, 2, 3])
+        snapshot[0] = 0
+        self.assertEqual(snapshot[0], 0)
+        with self.assertRaises(TypeError):
+            column[0] = 0
+        self.assertTrue(4 in column)
+        self.assertEqual(column.count(2), 2)
+        self.assertTrue([7, 1, 2, 2, 3, 4] in self.table.columns)
+        self.table.storage = self.table.STORAGE_SPARSE
+        self.assertEqual(
+            list(self.table.columns[-1]), ["boy", "girl", "boy", "girl", "boy", "girl"]
+        )
+        with self.assertRaises(IndexError):
+            self.table.columns[3]
+
+    def test_rows_share_table_reference(self):
+        row = self.table.rows[0]
+        self.assertFalse(hasattr(row, "__dict__"))
+        self.assertFalse(hasattr(self.table.columns.alignment, "__dict__"))
+        self.assertFalse(hasattr(self.table.columns["name"], "__dict__"))
+        # Rows are stored as plain lists, without a reference to the table
+        self.assertIs(type(self.table._data._value[0]), list)
+        row["rank"] = 5
+        self.assertEqual(self.table.rows[0], ["Jacob", 5, "boy"])
+        table = copy.deepcopy(self.table)
+        self.assertIs(table.rows[0]._table, table)
+
 
 if __name__ == "__main__":
     unittest.main()